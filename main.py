@@ -1,10 +1,15 @@
 """Main entry point for the Markdown Translator application."""
 
 import argparse
+import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import cast
 
 from src.api_client import GeminiAPIClient
+from src.cache import TranslationCache
 from src.file_service import FileSystemService
 from src.translation_service import TranslationService
 from src.orchestrator import TranslationOrchestrator
@@ -12,6 +17,37 @@ from src.config import TranslationConfig
 from src.exceptions import TranslatorError
 
 
+logger = logging.getLogger(__name__)
+
+
+def configure_logging() -> QueueListener:
+    """
+    Configure logging to stdout through a queue.
+
+    Records from worker threads are put on a queue and written by a single
+    listener thread, so workers never block on stdout.
+
+    Returns:
+        QueueListener: Started listener; join its queue to flush pending records
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    queue_handler = QueueHandler(log_queue)
+    # Only merge args into the message here; the stream handler applies the real format
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+
+    # Keep per-request logs from the HTTP stack and SDK out of the output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("google_genai").setLevel(logging.WARNING)
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command-line arguments.
@@ -27,6 +63,35 @@ def parse_arguments() -> argparse.Namespace:
         type=str,
         help="Directory containing Markdown files to translate"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of files translated in parallel (default: 4)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Maximum number of small files combined into one API request (default: 1)"
+    )
+    parser.add_argument(
+        "--requests-per-minute",
+        type=float,
+        default=None,
+        help="Maximum number of API requests per minute across all workers (default: unlimited)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Translate every file, even those unchanged since the last run"
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=None,
+        help="SQLite file used to cache translations between runs (default: disabled)"
+    )
     return parser.parse_args()
 
 
@@ -61,6 +126,7 @@ def main() -> int:
     Returns:
         int: Exit code (0=success, 1=error)
     """
+    listener = configure_logging()
     try:
         # Parse command-line arguments
         args = parse_arguments()
@@ -69,19 +135,19 @@ def main() -> int:
         try:
             source_dir = validate_directory(args.directory)
         except ValueError as e:
-            print(f"[ERROR] {e}")
+            logger.error("%s", e)
             return 1
 
-        print(f"[INFO] Source directory: {source_dir}")
+        logger.info("Source directory: %s", source_dir)
 
         # Load API key from .env file
         try:
             api_key = GeminiAPIClient.load_api_key_from_env()
         except FileNotFoundError as e:
-            print(f"[ERROR] {e}")
+            logger.error("%s", e)
             return 1
         except ValueError as e:
-            print(f"[ERROR] {e}")
+            logger.error("%s", e)
             return 1
 
         # Initialize components
@@ -94,29 +160,58 @@ def main() -> int:
                 model_name="gemini-3-flash-preview",
                 max_retries=3,
                 retry_delay=1.0,
-                rate_limit_wait=60.0
+                rate_limit_wait=60.0,
+                requests_per_minute=args.requests_per_minute,
+                concurrency=args.concurrency,
+                batch_size=args.batch_size,
+                incremental=not args.full,
+                cache_path=args.cache_path
             )
 
+            # Open the translation cache if requested
+            cache = TranslationCache(config.cache_path) if config.cache_path else None
+
             # Initialize API client with retry configuration
             api_client = GeminiAPIClient(
                 api_key,
                 model_name=config.model_name,
                 max_retries=config.max_retries,
                 retry_delay=config.retry_delay,
-                rate_limit_wait=config.rate_limit_wait
+                rate_limit_wait=config.rate_limit_wait,
+                cache=cache,
+                requests_per_minute=config.requests_per_minute
             )
             file_service = FileSystemService()
-            translation_service = TranslationService(api_client)
-            orchestrator = TranslationOrchestrator(file_service, translation_service)
+            translation_service = TranslationService(
+                api_client,
+                max_chunk_chars=config.max_chunk_chars
+            )
+            orchestrator = TranslationOrchestrator(
+                file_service,
+                translation_service,
+                concurrency=config.concurrency,
+                incremental=config.incremental,
+                batch_size=config.batch_size
+            )
         except Exception as e:
-            print(f"[ERROR] Failed to initialize application: {e}")
+            logger.error("Failed to initialize application: %s", e)
             return 1
 
         # Execute translation
-        print("[INFO] Starting translation process...")
-        results = orchestrator.translate_directory(source_dir, output_dir_name=config.output_directory_name)
-
-        # Print summary
+        logger.info("Starting translation process...")
+        try:
+            results = orchestrator.translate_directory(
+                source_dir,
+                output_dir_name=config.output_directory_name
+            )
+        finally:
+            file_service.close()
+            api_client.close()
+            if cache is not None:
+                cache.close()
+
+        # Print summary once all queued log records have been written
+        cast(queue.Queue, listener.queue).join()
         orchestrator.print_summary(results)
 
         # Determine exit code based on results
@@ -131,11 +226,14 @@ def main() -> int:
         return 0
 
     except KeyboardInterrupt:
-        print("\n[INFO] Translation interrupted by user")
+        logger.info("Translation interrupted by user")
         return 1
     except Exception as e:
-        print(f"[ERROR] Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return 1
+    finally:
+        # Write out any log records still queued
+        listener.stop()
 
 
 if __name__ == "__main__":
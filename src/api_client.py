@@ -1,10 +1,36 @@
 """GCP Gemini API client for text translation."""
 
 from pathlib import Path
+from typing import Callable, Optional, TypeVar
+import logging
+import random
 import time
 import os
+import re
+import stat
 from google import genai
-from .exceptions import APIError, RateLimitError
+from google.genai import errors as genai_errors
+from google.genai import types
+from .cache import TranslationCache
+from .exceptions import APIError, CacheError, RateLimitError
+from .rate_limiter import TokenBucket
+
+
+logger = logging.getLogger(__name__)
+
+# First "key=<value>" line in a .env file; [^\S\n] is whitespace that does not cross lines
+_ENV_KEY_RE = re.compile(r'^[^\S\n]*key[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+
+# Server-suggested retry delay in error messages, e.g. "Please retry in 37.5s" or "'retryDelay': '37s'"
+_RETRY_HINT_RE = re.compile(r'(?:retry in |retryDelay[\'"]?:\s*[\'"])([\d.]+)\s*s', re.IGNORECASE)
+
+# Substrings identifying rate limit errors that carry no HTTP status code
+_RATE_LIMIT_TOKENS = ("quota", "rate limit", "429", "resource exhausted", "resource_exhausted")
+
+# Server retry hints are capped at this multiple of rate_limit_wait so a bogus hint cannot stall a worker
+_MAX_RETRY_HINT_FACTOR = 5
+
+T = TypeVar("T")
 
 
 class GeminiAPIClient:
@@ -13,10 +39,12 @@ class GeminiAPIClient:
     def __init__(
         self,
         api_key: str,
-        model_name: str = None,
+        model_name: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        rate_limit_wait: float = 60.0
+        rate_limit_wait: float = 60.0,
+        cache: Optional[TranslationCache] = None,
+        requests_per_minute: Optional[float] = None
     ):
         """
         Initialize the API client.
@@ -27,9 +55,13 @@ class GeminiAPIClient:
             max_retries: Maximum number of retries for transient errors (default: 3)
             retry_delay: Initial retry delay in seconds for exponential backoff (default: 1.0)
             rate_limit_wait: Wait time in seconds for rate limit errors (default: 60.0)
+            cache: Persistent cache of previous translations (default: None, disabled)
+            requests_per_minute: Maximum request rate shared by all threads using
+                this client, including retries (default: None, unlimited)
 
         Raises:
-            ValueError: If API key is invalid or empty
+            ValueError: If API key is invalid or empty, or requests_per_minute
+                is not positive
         """
         if not api_key or not isinstance(api_key, str) or not api_key.strip():
             raise ValueError("API key must be a non-empty string")
@@ -37,17 +69,42 @@ class GeminiAPIClient:
         try:
             self.client = genai.Client(api_key=api_key.strip())
             # Allow model name override via parameter, env var, or default
-            self.model_name = model_name or os.getenv("GEMINI_MODEL", "gemini-3-flash-preview")
+            self.model_name: str = model_name or os.getenv("GEMINI_MODEL") or "gemini-3-flash-preview"
             self.max_retries = max_retries
             self.retry_delay = retry_delay
             self.rate_limit_wait = rate_limit_wait
+            self.cache = cache
+            # Shared by every worker thread so parallel requests stay under the quota
+            self._rate_limiter = TokenBucket(requests_per_minute) if requests_per_minute is not None else None
+            # Generation configs keyed by (target language, extra instruction), built once
+            # and reused for every request
+            self._generation_configs: dict[tuple[str, str], types.GenerateContentConfig] = {}
         except Exception as e:
             raise ValueError(f"Failed to initialize Gemini API client: {e}")
 
+    def close(self) -> None:
+        """
+        Release the HTTP connection pool held by the underlying SDK client.
+
+        The SDK client keeps its connections alive between requests, so a
+        single GeminiAPIClient should be reused for a whole run and closed at
+        the end.
+        """
+        self.client.close()
+
+    def __enter__(self) -> "GeminiAPIClient":
+        """Return the client for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the client when leaving a with statement."""
+        self.close()
+
     def translate_text(
         self,
         text: str,
-        target_language: str = "Japanese"
+        target_language: str = "Japanese",
+        instruction: str = ""
     ) -> str:
         """
         Translate text to the target language with retry logic.
@@ -55,6 +112,8 @@ class GeminiAPIClient:
         Args:
             text: Text to translate
             target_language: Target language (default: Japanese)
+            instruction: Extra system instruction appended to the translation
+                instruction, e.g. about the layout of the response (default: none)
 
         Returns:
             str: Translated text
@@ -66,81 +125,267 @@ class GeminiAPIClient:
         if not text or not text.strip():
             return text
 
-        prompt = f"Translate the following text to {target_language}. Preserve all Markdown formatting exactly as it appears. Only return the translated text without any additional explanation:\n\n{text}"
+        cache_key: Optional[bytes] = None
+        if self.cache is not None:
+            cache_key = TranslationCache.make_key(self.model_name, target_language, text, instruction)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-        last_exception = None
+        config = self._generation_config(target_language, instruction)
+        translated = self._retry(lambda: self._generate(text, config))
 
-        for attempt in range(self.max_retries):
-            try:
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=prompt
-                )
+        if cache_key is not None:
+            self._cache_set(cache_key, translated)
+        return translated
 
-                if not response or not response.text:
-                    raise APIError("API returned empty response")
+    def _generation_config(self, target_language: str, instruction: str = "") -> types.GenerateContentConfig:
+        """
+        Get the generation config carrying the translation instruction.
 
-                return response.text.strip()
+        The instruction is sent as a system instruction rather than prepended to
+        the text, so the request prefix is identical across calls and the text
+        is passed through without string concatenation.
 
-            except RateLimitError as e:
-                last_exception = e
-                if attempt < self.max_retries - 1:
-                    print(f"[WARNING] Rate limit reached. Waiting {self.rate_limit_wait} seconds before retry (attempt {attempt + 1}/{self.max_retries})...")
-                    time.sleep(self.rate_limit_wait)
-                else:
-                    print(f"[ERROR] Rate limit reached. Max retries ({self.max_retries}) exceeded.")
-                    raise
+        Args:
+            target_language: Target language
+            instruction: Extra instruction appended to the system instruction
+
+        Returns:
+            types.GenerateContentConfig: Config for generate_content
+        """
+        config = self._generation_configs.get((target_language, instruction))
+        if config is None:
+            system_instruction = (
+                f"Translate the text provided by the user to {target_language}. "
+                "Preserve all Markdown formatting exactly as it appears. "
+                "Only return the translated text without any additional explanation."
+            )
+            if instruction:
+                system_instruction += " " + instruction
+            config = types.GenerateContentConfig(system_instruction=system_instruction)
+            self._generation_configs[(target_language, instruction)] = config
+        return config
+
+    def _generate(self, text: str, config: types.GenerateContentConfig) -> str:
+        """
+        Send a single generate_content request.
+
+        Args:
+            text: Text to translate
+            config: Generation config with the translation instruction
+
+        Returns:
+            str: Response text with surrounding whitespace removed
 
+        Raises:
+            APIError: If the API returns an empty response
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+        response = self.client.models.generate_content(
+            model=self.model_name,
+            contents=text,
+            config=config
+        )
+
+        if not response or not response.text:
+            raise APIError("API returned empty response")
+
+        return response.text.strip()
+
+    def _retry(self, fn: Callable[[], T]) -> T:
+        """
+        Call fn, retrying on API and rate limit errors.
+
+        Generic API errors are retried with exponential backoff and jitter.
+        Rate limit errors wait for the server-suggested delay when one is
+        available, otherwise for a jittered rate_limit_wait, so concurrent
+        workers do not all retry at the same moment.
+
+        Args:
+            fn: Callable performing one API request
+
+        Returns:
+            T: Return value of fn
+
+        Raises:
+            APIError: If the call fails after all retries
+            RateLimitError: If rate limit is reached after all retries
+        """
+        last_exception: Optional[APIError] = None
+        cause: Exception
+
+        for attempt in range(self.max_retries):
+            try:
+                return fn()
             except APIError as e:
+                # Includes RateLimitError
                 last_exception = e
-                if attempt < self.max_retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    print(f"[WARNING] API error occurred. Retrying in {wait_time} seconds (attempt {attempt + 1}/{self.max_retries})...")
-                    time.sleep(wait_time)
-                else:
-                    print(f"[ERROR] API error occurred. Max retries ({self.max_retries}) exceeded.")
-                    raise
-
+                cause = e
             except Exception as e:
-                error_message = str(e).lower()
-
-                # Check for rate limit errors
-                if "quota" in error_message or "rate limit" in error_message or "429" in error_message:
-                    last_exception = RateLimitError(f"API rate limit reached: {e}")
-                    if attempt < self.max_retries - 1:
-                        print(f"[WARNING] Rate limit reached. Waiting {self.rate_limit_wait} seconds before retry (attempt {attempt + 1}/{self.max_retries})...")
-                        time.sleep(self.rate_limit_wait)
-                    else:
-                        print(f"[ERROR] Rate limit reached. Max retries ({self.max_retries}) exceeded.")
-                        raise last_exception
-
-                # Check for resource exhausted errors (also rate limiting)
-                elif "resource exhausted" in error_message or "resource_exhausted" in error_message:
-                    last_exception = RateLimitError(f"API rate limit reached: {e}")
-                    if attempt < self.max_retries - 1:
-                        print(f"[WARNING] Rate limit reached. Waiting {self.rate_limit_wait} seconds before retry (attempt {attempt + 1}/{self.max_retries})...")
-                        time.sleep(self.rate_limit_wait)
-                    else:
-                        print(f"[ERROR] Rate limit reached. Max retries ({self.max_retries}) exceeded.")
-                        raise last_exception
-
-                # All other errors are generic API errors with exponential backoff
-                else:
-                    last_exception = APIError(f"API call failed: {e}")
-                    if attempt < self.max_retries - 1:
-                        wait_time = self.retry_delay * (2 ** attempt)
-                        print(f"[WARNING] API error occurred. Retrying in {wait_time} seconds (attempt {attempt + 1}/{self.max_retries})...")
-                        time.sleep(wait_time)
-                    else:
-                        print(f"[ERROR] API error occurred. Max retries ({self.max_retries}) exceeded.")
-                        raise last_exception
+                last_exception = self._classify_error(e)
+                cause = e
+
+            is_rate_limit = isinstance(last_exception, RateLimitError)
+            kind = "Rate limit reached" if is_rate_limit else "API error occurred"
+
+            if attempt >= self.max_retries - 1:
+                logger.error("%s. Max retries (%d) exceeded.", kind, self.max_retries)
+                raise last_exception
+
+            if is_rate_limit:
+                wait_time = self._rate_limit_delay(cause)
+                logger.warning(
+                    "%s. Waiting %.2f seconds before retry (attempt %d/%d)...",
+                    kind, wait_time, attempt + 1, self.max_retries
+                )
+            else:
+                wait_time = self._backoff_delay(attempt)
+                logger.warning(
+                    "%s. Retrying in %.2f seconds (attempt %d/%d)...",
+                    kind, wait_time, attempt + 1, self.max_retries
+                )
+            time.sleep(wait_time)
 
         # This should not be reached, but just in case
         if last_exception:
             raise last_exception
         raise APIError("Translation failed after all retries")
 
+    @staticmethod
+    def _classify_error(error: Exception) -> APIError:
+        """
+        Convert an SDK exception into RateLimitError or APIError.
+
+        Args:
+            error: Exception raised by the SDK
+
+        Returns:
+            APIError: RateLimitError for quota/429/resource exhausted errors, APIError otherwise
+        """
+        # SDK errors carry the HTTP status code, which is authoritative
+        if isinstance(error, genai_errors.APIError):
+            if error.code == 429:
+                return RateLimitError(f"API rate limit reached: {error}")
+            return APIError(f"API call failed: {error}")
+
+        # Otherwise fall back to matching the message once against all rate limit tokens
+        error_message = str(error).lower()
+        if any(token in error_message for token in _RATE_LIMIT_TOKENS):
+            return RateLimitError(f"API rate limit reached: {error}")
+
+        # All other errors are generic API errors
+        return APIError(f"API call failed: {error}")
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with jitter: a random delay in [d/2, d], d = retry_delay * 2**attempt.
+
+        The delay is capped at rate_limit_wait.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        delay = min(self.rate_limit_wait, self.retry_delay * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+    def _rate_limit_delay(self, error: Exception) -> float:
+        """
+        Delay before retrying after a rate limit error.
+
+        Uses the server-suggested delay (retry_delay attribute, Retry-After
+        header or "retry in Ns" message) when present, otherwise a random delay
+        in [rate_limit_wait/2, rate_limit_wait]. The server hint is capped at
+        5 * rate_limit_wait.
+
+        Args:
+            error: Exception that signalled the rate limit
+
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        hint = self._retry_after_hint(error)
+        if hint is not None:
+            hint = min(hint, self.rate_limit_wait * _MAX_RETRY_HINT_FACTOR)
+            # Small jitter on top of the server hint so workers do not retry in lockstep
+            return hint + random.uniform(0, min(1.0, hint * 0.1))
+
+        return random.uniform(self.rate_limit_wait / 2, self.rate_limit_wait)
+
+    @staticmethod
+    def _retry_after_hint(error: Exception) -> Optional[float]:
+        """
+        Extract a server-suggested retry delay from an exception.
+
+        Args:
+            error: Exception raised by the SDK
+
+        Returns:
+            Optional[float]: Delay in seconds, or None if the error carries no hint
+        """
+        retry_delay = getattr(error, "retry_delay", None)
+        if isinstance(retry_delay, (int, float)) and retry_delay >= 0:
+            return float(retry_delay)
+
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers is not None:
+            try:
+                retry_after = headers.get("Retry-After")
+                if retry_after is not None:
+                    return max(0.0, float(retry_after))
+            except (AttributeError, TypeError, ValueError):
+                # Missing or HTTP-date formatted header: fall back to the message
+                pass
+
+        match = _RETRY_HINT_RE.search(str(error))
+        if match:
+            try:
+                return float(match.group(1))
+            except ValueError:
+                return None
+
+        return None
+
+    def _cache_get(self, key: bytes) -> Optional[str]:
+        """
+        Look up a cached translation, treating cache failures as misses.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[str]: Cached translation, or None if not available
+        """
+        if self.cache is None:
+            return None
+
+        try:
+            return self.cache.get(key)
+        except CacheError as e:
+            logger.warning("%s", e)
+            return None
+
+    def _cache_set(self, key: bytes, value: str) -> None:
+        """
+        Store a translation in the cache, ignoring cache failures.
+
+        Args:
+            key: Cache key
+            value: Translated text
+        """
+        if self.cache is None:
+            return
+
+        try:
+            self.cache.set(key, value)
+        except CacheError as e:
+            logger.warning("%s", e)
+
     @staticmethod
     def load_api_key_from_env(env_file: Path = Path(".env")) -> str:
         """
@@ -156,38 +401,34 @@ class GeminiAPIClient:
             FileNotFoundError: If .env file does not exist
             ValueError: If API key is not found in .env file
         """
-        if not env_file.exists():
+        # A single stat() answers both "exists?" and "is a regular file?"
+        try:
+            mode = env_file.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f".env file not found: {env_file}")
+        except OSError as e:
+            raise ValueError(f"Failed to read .env file: {e}")
 
-        if not env_file.is_file():
+        if not stat.S_ISREG(mode):
             raise ValueError(f"Path is not a file: {env_file}")
 
         try:
-            content = env_file.read_text(encoding="utf-8")
+            content = env_file.read_bytes().decode("utf-8")
         except Exception as e:
             raise ValueError(f"Failed to read .env file: {e}")
 
-        # Parse the .env file looking for "key=" format
-        for line in content.splitlines():
-            line = line.strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith("#"):
-                continue
-
-            # Look for "key=" format
-            if line.startswith("key="):
-                api_key = line[4:].strip()  # Extract everything after "key="
+        # Find the first "key=" line in a single scan (comment lines never match)
+        match = _ENV_KEY_RE.search(content)
+        if match:
+            api_key = match.group(1)
 
-                # Remove quotes if present
-                if api_key.startswith('"') and api_key.endswith('"'):
-                    api_key = api_key[1:-1]
-                elif api_key.startswith("'") and api_key.endswith("'"):
-                    api_key = api_key[1:-1]
+            # Remove quotes if present
+            if len(api_key) >= 2 and api_key[0] == api_key[-1] and api_key[0] in ('"', "'"):
+                api_key = api_key[1:-1]
 
-                if api_key:
-                    return api_key
-                else:
-                    raise ValueError("API key value is empty in .env file")
+            if api_key:
+                return api_key
+            else:
+                raise ValueError("API key value is empty in .env file")
 
         raise ValueError("API key not found in .env file (expected format: key=<your_api_key>)")
@@ -0,0 +1,135 @@
+"""Persistent translation cache for the Markdown Translator."""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .exceptions import CacheError
+
+
+class TranslationCache:
+    """SQLite-backed cache of translated text keyed by a content hash."""
+
+    def __init__(self, db_path: Path, commit_interval: int = 50):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file
+            commit_interval: Number of writes to buffer before committing (default: 50)
+
+        Raises:
+            CacheError: If the database cannot be opened
+        """
+        self.db_path = db_path
+        self.commit_interval = commit_interval
+        self._pending_writes = 0
+        # The orchestrator calls the API client from worker threads
+        self._lock = threading.Lock()
+
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            # WAL lets readers proceed during commits; NORMAL skips the per-commit
+            # fsync, which at worst loses recent entries that can be re-fetched
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations (key BLOB PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            raise CacheError(f"Failed to open translation cache {db_path}: {e}")
+
+    @staticmethod
+    def make_key(model_name: str, target_language: str, text: str, instruction: str = "") -> bytes:
+        """
+        Build the cache key for a translation request.
+
+        Args:
+            model_name: Model used for the translation
+            target_language: Target language of the translation
+            text: Source text (surrounding whitespace is ignored)
+            instruction: Extra system instruction sent with the request
+                (default: none; keys without one are unchanged)
+
+        Returns:
+            bytes: 16-byte BLAKE2b digest
+        """
+        prefix = f"{model_name}|{target_language}|{instruction}|" if instruction else f"{model_name}|{target_language}|"
+        payload = f"{prefix}{text.strip()}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Look up a cached translation.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[str]: Cached translation, or None on a cache miss
+
+        Raises:
+            CacheError: If the lookup fails
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM translations WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            raise CacheError(f"Failed to read translation cache: {e}")
+
+        return row[0] if row else None
+
+    def set(self, key: bytes, value: str) -> None:
+        """
+        Store a translation, committing once enough writes are buffered.
+
+        Args:
+            key: Cache key from make_key
+            value: Translated text
+
+        Raises:
+            CacheError: If the write fails
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO translations (key, value) VALUES (?, ?)",
+                    (key, value)
+                )
+                self._pending_writes += 1
+                if self._pending_writes >= self.commit_interval:
+                    self._conn.commit()
+                    self._pending_writes = 0
+        except sqlite3.Error as e:
+            raise CacheError(f"Failed to write translation cache: {e}")
+
+    def flush(self) -> None:
+        """
+        Commit any buffered writes.
+
+        Raises:
+            CacheError: If the commit fails
+        """
+        try:
+            with self._lock:
+                self._conn.commit()
+                self._pending_writes = 0
+        except sqlite3.Error as e:
+            raise CacheError(f"Failed to write translation cache: {e}")
+
+    def close(self) -> None:
+        """
+        Commit buffered writes and close the database.
+
+        Raises:
+            CacheError: If the final commit fails
+        """
+        self.flush()
+        with self._lock:
+            self._conn.close()
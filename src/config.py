@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 
 @dataclass
@@ -14,3 +15,9 @@ class TranslationConfig:
     max_retries: int = 3
     retry_delay: float = 1.0  # Initial retry delay in seconds (exponential backoff)
     rate_limit_wait: float = 60.0  # Wait time for rate limit errors in seconds
+    requests_per_minute: Optional[float] = None  # Client-side API request rate cap (None disables it)
+    concurrency: int = 4  # Maximum number of files translated in parallel
+    batch_size: int = 1  # Maximum number of small files combined into one request
+    max_chunk_chars: int = 20000  # Longer documents are split into sections translated in parallel
+    incremental: bool = True  # Skip files unchanged since the last run
+    cache_path: Optional[Path] = None  # SQLite translation cache (None disables caching)
@@ -24,3 +24,8 @@ class RateLimitError(APIError):
 class FileSystemError(TranslatorError):
     """Exception raised during file system operations."""
     pass
+
+
+class CacheError(TranslatorError):
+    """Exception raised during translation cache operations."""
+    pass
@@ -1,12 +1,62 @@
 """File system operations for the Markdown Translator application."""
 
+import asyncio
+import functools
+import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator, Union
 from .exceptions import FileSystemError
 
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=8192)
+def _mirror_parent(source_dir: Path, output_dir_name: str, parent: Path) -> Path:
+    """
+    Map a directory inside the source tree to its counterpart in the output tree.
+
+    Files share their parent directory, so caching this keeps the per-file cost
+    of create_output_path to a single join.
+
+    Args:
+        source_dir: Source directory path
+        output_dir_name: Output directory name
+        parent: Directory inside source_dir
+
+    Returns:
+        Path: source_dir / output_dir_name / (parent relative to source_dir)
+
+    Raises:
+        ValueError: If parent is not inside source_dir
+    """
+    return source_dir / output_dir_name / parent.relative_to(source_dir)
+
+
 class FileSystemService:
     """Service for file system operations."""
 
+    def __init__(self, io_workers: int = 2):
+        """
+        Initialize the service.
+
+        Args:
+            io_workers: Number of threads used by the async read and write
+                methods (default: 2)
+        """
+        # Output directories already created by write_file, so repeated writes skip mkdir
+        self._created_dirs: set[Path] = set()
+        # Disk I/O gets its own pool so it never waits behind in-flight API calls
+        # on the event loop's default executor. Threads are started on first use.
+        self._io_executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="file-io")
+
+    def close(self) -> None:
+        """Shut down the I/O threads used by the async read and write methods."""
+        self._io_executor.shutdown()
+
     def find_markdown_files(self, directory: Path) -> list[Path]:
         """
         Recursively find all Markdown files in a directory.
@@ -20,19 +70,81 @@ class FileSystemService:
         Raises:
             FileSystemError: If directory access fails
         """
-        if not directory.exists():
-            raise FileSystemError(f"Directory does not exist: {directory}")
+        return sorted(self.iter_markdown_files(directory))  # Sort for consistent ordering
 
-        if not directory.is_dir():
-            raise FileSystemError(f"Path is not a directory: {directory}")
+    def iter_markdown_files(
+        self,
+        directory: Path,
+        exclude_dirs: Iterable[Path] = ()
+    ) -> Iterator[Path]:
+        """
+        Lazily yield all Markdown files in a directory tree.
 
+        The directory itself is validated immediately; subdirectories are
+        scanned as the iterator is consumed, so callers can start working on
+        the first files before the walk has finished. Files are yielded in no
+        particular order.
+
+        Args:
+            directory: Directory to search
+            exclude_dirs: Directories inside the tree that are not descended into
+
+        Returns:
+            Iterator[Path]: Iterator over Markdown file paths
+
+        Raises:
+            FileSystemError: If directory access fails
+        """
+        # A single stat() answers both "exists?" and "is a directory?"
         try:
-            # Use rglob to recursively find all .md files
-            markdown_files = list(directory.rglob("*.md"))
-            return sorted(markdown_files)  # Sort for consistent ordering
-        except Exception as e:
+            mode = directory.stat().st_mode
+        except FileNotFoundError:
+            raise FileSystemError(f"Directory does not exist: {directory}")
+        except OSError as e:
             raise FileSystemError(f"Failed to scan directory {directory}: {e}")
 
+        if not stat.S_ISDIR(mode):
+            raise FileSystemError(f"Path is not a directory: {directory}")
+
+        return self._scan_markdown_files(directory, {str(d) for d in exclude_dirs})
+
+    def _scan_markdown_files(self, directory: Path, exclude_dirs: set[str]) -> Iterator[Path]:
+        """
+        Walk a directory tree with os.scandir, yielding Markdown files.
+
+        Subdirectories that disappear or cannot be read during the walk are
+        skipped with a warning.
+
+        Args:
+            directory: Root directory to walk
+            exclude_dirs: Directory paths (as strings) that are not descended into
+
+        Yields:
+            Path: Markdown file path
+
+        Raises:
+            FileSystemError: If the root directory, or any directory failing
+                with an unexpected error, cannot be scanned
+        """
+        stack: list[Union[Path, str]] = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        # DirEntry caches the file type, so no extra stat() is needed
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path not in exclude_dirs:
+                                stack.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            yield Path(entry.path)
+            except (PermissionError, FileNotFoundError) as e:
+                if current is directory:
+                    raise FileSystemError(f"Failed to scan directory {current}: {e}")
+                logger.warning("Skipping unreadable directory %s: %s", current, e)
+            except OSError as e:
+                raise FileSystemError(f"Failed to scan directory {current}: {e}")
+
     def read_file(self, file_path: Path) -> str:
         """
         Read file content.
@@ -46,14 +158,29 @@ class FileSystemService:
         Raises:
             IOError: If file read fails
         """
-        if not file_path.exists():
+        # Open directly and map the failure, instead of checking exists()/is_file() first.
+        # A raw fd read sized from fstat skips the buffered and text I/O layers.
+        try:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                file_stat = os.fstat(fd)
+                if stat.S_ISDIR(file_stat.st_mode):
+                    raise IsADirectoryError
+                size = file_stat.st_size
+                data = os.read(fd, size)
+                # Short reads only happen for very large files or files that shrank
+                while len(data) < size:
+                    chunk = os.read(fd, size - len(data))
+                    if not chunk:
+                        break
+                    data += chunk
+            finally:
+                os.close(fd)
+            return data.decode("utf-8")
+        except FileNotFoundError:
             raise IOError(f"File does not exist: {file_path}")
-
-        if not file_path.is_file():
+        except IsADirectoryError:
             raise IOError(f"Path is not a file: {file_path}")
-
-        try:
-            return file_path.read_text(encoding="utf-8")
         except Exception as e:
             raise IOError(f"Failed to read file {file_path}: {e}")
 
@@ -68,15 +195,54 @@ class FileSystemService:
         Raises:
             IOError: If file write fails
         """
+        parent = file_path.parent
         try:
-            # Ensure parent directory exists
-            self.ensure_directory_exists(file_path.parent)
+            # Ensure parent directory exists (once per directory)
+            if parent not in self._created_dirs:
+                self.ensure_directory_exists(parent)
+                self._created_dirs.add(parent)
 
             # Write the file
-            file_path.write_text(content, encoding="utf-8")
+            data = content.encode("utf-8")
+            try:
+                file_path.write_bytes(data)
+            except FileNotFoundError:
+                # The directory was removed since it was created; create it again
+                self.ensure_directory_exists(parent)
+                file_path.write_bytes(data)
         except Exception as e:
             raise IOError(f"Failed to write file {file_path}: {e}")
 
+    async def read_file_async(self, file_path: Path) -> str:
+        """
+        Read file content on the I/O thread pool without blocking the event loop.
+
+        Args:
+            file_path: Path to file to read
+
+        Returns:
+            str: File content
+
+        Raises:
+            IOError: If file read fails
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_executor, self.read_file, file_path)
+
+    async def write_file_async(self, file_path: Path, content: str) -> None:
+        """
+        Write content to file on the I/O thread pool without blocking the event loop.
+
+        Args:
+            file_path: Path to file to write
+            content: Content to write
+
+        Raises:
+            IOError: If file write fails
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_executor, self.write_file, file_path, content)
+
     def create_output_path(
         self,
         source_file: Path,
@@ -100,17 +266,14 @@ class FileSystemService:
             output_dir_name: jp
             result: /path/to/source/jp/docs/guide.md
         """
-        # Get relative path from source directory
+        # Create output path: source_dir / output_dir_name / relative_path
         try:
-            relative_path = source_file.relative_to(source_dir)
+            output_parent = _mirror_parent(source_dir, output_dir_name, source_file.parent)
         except ValueError:
             # If source_file is not relative to source_dir, just use the filename
-            relative_path = source_file.name
-
-        # Create output path: source_dir / output_dir_name / relative_path
-        output_path = source_dir / output_dir_name / relative_path
+            output_parent = source_dir / output_dir_name
 
-        return output_path
+        return output_parent / source_file.name
 
     def ensure_directory_exists(self, directory: Path) -> None:
         """
@@ -1,20 +1,40 @@
 """Orchestrator for coordinating the translation process."""
 
+import asyncio
+import itertools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Sequence, Union
 
 from .file_service import FileSystemService
+from .translation_index import TranslationIndex
 from .translation_service import TranslationService
 from .exceptions import TranslationError
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Records passed between the pipeline stages; None tells a stage to stop
+_FileItem = Optional[tuple[Path, str]]  # (source file, translated stem)
+_ContentItem = Optional[tuple[Path, str, str]]  # (source file, translated stem, content)
+
+
+@dataclass(slots=True, frozen=True)
 class TranslationResult:
-    """Data class representing the result of a file translation."""
+    """
+    Data class representing the result of a file translation.
+
+    One instance is kept per file, so slots keep large runs small; results
+    are never modified after creation.
+    """
     source_file: Path
     success: bool
     error_message: Optional[str] = None
+    output_file: Optional[Path] = None
+    cached: bool = False  # True if skipped because the file was unchanged since the last run
 
 
 class TranslationOrchestrator:
@@ -23,7 +43,12 @@ class TranslationOrchestrator:
     def __init__(
         self,
         file_service: FileSystemService,
-        translation_service: TranslationService
+        translation_service: TranslationService,
+        concurrency: int = 1,
+        filename_batch_size: int = 50,
+        incremental: bool = False,
+        max_workers: Optional[int] = None,
+        batch_size: int = 1
     ):
         """
         Initialize the orchestrator.
@@ -31,19 +56,82 @@ class TranslationOrchestrator:
         Args:
             file_service: FileSystemService instance for file operations
             translation_service: TranslationService instance for translation
+            concurrency: Maximum number of files translated in parallel (default: 1)
+            filename_batch_size: Number of filenames translated per API call (default: 50)
+            incremental: Skip files unchanged since the last run, tracked in a
+                sidecar index in the source directory (default: False)
+            max_workers: Size of the thread pool that blocking file and API calls
+                run on in translate_directory (default: min(32, cpu_count * 4))
+            batch_size: Maximum number of files sent in a single translation
+                request. Files already read are combined while they fit within
+                the translation service's max_chunk_chars (default: 1)
+
+        Raises:
+            ValueError: If concurrency, filename_batch_size, max_workers or
+                batch_size is less than 1
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        if filename_batch_size < 1:
+            raise ValueError("filename_batch_size must be at least 1")
+
+        if max_workers is None:
+            # The work is I/O-bound, so oversubscribe the CPUs
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        elif max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
         self.file_service = file_service
         self.translation_service = translation_service
+        self.concurrency = concurrency
+        self.filename_batch_size = filename_batch_size
+        self.incremental = incremental
+        self.max_workers = max_workers
+        self.batch_size = batch_size
 
     def translate_directory(self, source_dir: Path, output_dir_name: str = "jp") -> list[TranslationResult]:
         """
         Translate all Markdown files in a directory.
 
+        Synchronous wrapper around translate_directory_async. Blocking file
+        and API calls run on a thread pool of `max_workers` threads.
+
+        Args:
+            source_dir: Source directory containing Markdown files
+            output_dir_name: Name of the output directory (default: "jp")
+
+        Returns:
+            list[TranslationResult]: Results for each file translation
+        """
+        with asyncio.Runner() as runner:
+            # The runner shuts the pool down when it closes
+            runner.get_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="translate")
+            )
+            return runner.run(self.translate_directory_async(source_dir, output_dir_name))
+
+    async def translate_directory_async(
+        self,
+        source_dir: Path,
+        output_dir_name: str = "jp"
+    ) -> list[TranslationResult]:
+        """
+        Translate all Markdown files in a directory concurrently.
+
         This method coordinates the entire translation process:
-        1. Find all Markdown files in the source directory
-        2. For each file, read, translate, and write the output
-        3. Continue processing even if individual files fail
-        4. Return results for all files
+        1. Walk the source directory for Markdown files
+        2. Translate filenames in batches as files are discovered, so
+           translation starts before the walk has finished. In incremental
+           mode, files unchanged since the last run are skipped
+        3. Pass each file through a reader, `concurrency` translators and a
+           writer connected by bounded queues, so disk reads and writes
+           overlap with API calls. Processing continues even if individual
+           files fail
+        4. Return results for all files, sorted by source path
 
         Args:
             source_dir: Source directory containing Markdown files
@@ -52,100 +140,369 @@ class TranslationOrchestrator:
         Returns:
             list[TranslationResult]: Results for each file translation
         """
-        results = []
+        results: list[TranslationResult] = []
+
+        # A missing or non-directory root yields no results rather than an error
+        if not os.path.isdir(source_dir):
+            logger.error("Failed to find Markdown files: Not a directory: %s", source_dir)
+            return results
 
-        # Find all Markdown files
+        # Start the directory walk
         try:
-            markdown_files = self.file_service.find_markdown_files(source_dir)
+            # Previously written translations are not sources themselves
+            markdown_files = self.file_service.iter_markdown_files(
+                source_dir,
+                exclude_dirs=[source_dir / output_dir_name]
+            )
         except Exception as e:
             # If we can't even find files, return empty results
-            print(f"[ERROR] Failed to find Markdown files: {e}")
+            logger.error("Failed to find Markdown files: %s", e)
             return results
 
-        if not markdown_files:
-            print("[INFO] No Markdown files found in directory")
-            return results
+        index = TranslationIndex(source_dir) if self.incremental else None
+        stat_keys: dict[Path, tuple[int, int]] = {}
+
+        # Bounded queues between the stages cap how many documents are held in memory
+        maxsize = self.concurrency * 2
+        file_queue: asyncio.Queue[_FileItem] = asyncio.Queue(maxsize=maxsize)
+        read_queue: asyncio.Queue[_ContentItem] = asyncio.Queue(maxsize=maxsize)
+        write_queue: asyncio.Queue[_ContentItem] = asyncio.Queue(maxsize=maxsize)
+
+        discover_task = asyncio.create_task(
+            self._discover(markdown_files, file_queue, source_dir, index, stat_keys, results)
+        )
+        reader_task = asyncio.create_task(self._reader(file_queue, read_queue, source_dir, results))
+        translator_tasks = [
+            asyncio.create_task(self._translator(read_queue, write_queue, source_dir, results))
+            for _ in range(self.concurrency)
+        ]
+        writer_task = asyncio.create_task(
+            self._writer(write_queue, source_dir, output_dir_name, results)
+        )
+        found_count, *_ = await asyncio.gather(discover_task, reader_task, *translator_tasks, writer_task)
+
+        if not found_count:
+            logger.info("No Markdown files found in directory")
+
+        if index is not None:
+            for result in results:
+                key = stat_keys.get(result.source_file)
+                # Successful translations (not skipped files) always carry their output path
+                if result.success and not result.cached and key is not None and result.output_file:
+                    index.record(result.source_file, key, result.output_file)
+            await asyncio.to_thread(index.save)
+
+        results.sort(key=lambda r: r.source_file)
+        return results
+
+    async def _discover(
+        self,
+        markdown_files: Iterator[Path],
+        file_queue: asyncio.Queue[_FileItem],
+        source_dir: Path,
+        index: Optional[TranslationIndex],
+        stat_keys: dict[Path, tuple[int, int]],
+        results: list[TranslationResult]
+    ) -> int:
+        """
+        Pull files from the directory walk in batches and queue them for reading.
 
-        print(f"[INFO] Found {len(markdown_files)} Markdown file(s) to translate")
+        Filenames are translated one batch at a time, so files are queued
+        before the walk has finished. A None sentinel is queued when done.
 
-        # Process each file
-        for source_file in markdown_files:
-            result = self._translate_single_file(source_file, source_dir, output_dir_name)
-            results.append(result)
+        Args:
+            markdown_files: Iterator over the Markdown files to translate
+            file_queue: Queue that (source file, translated stem) pairs are put on
+            source_dir: Source directory (for log messages)
+            index: Index of previously translated files, or None if not incremental
+            stat_keys: Dict that the (mtime_ns, size) of each file to translate is stored in
+            results: List that results for skipped files are appended to
 
-        return results
+        Returns:
+            int: Number of Markdown files found
+        """
+        found_count = 0
+        try:
+            while True:
+                # Pull the next batch of files from the walk without blocking the event loop
+                batch = await asyncio.to_thread(
+                    list,
+                    itertools.islice(markdown_files, self.filename_batch_size)
+                )
+                if not batch:
+                    break
+
+                found_count += len(batch)
+                logger.info("Found %d Markdown file(s) to translate", len(batch))
+
+                if index is not None:
+                    try:
+                        pending, skipped = await asyncio.to_thread(
+                            self._skip_unchanged, batch, source_dir, index, stat_keys
+                        )
+                    except Exception as e:
+                        # A broken index must not stop the run; translate the whole batch instead
+                        logger.warning("Translation index check failed, translating all files in batch: %s", e)
+                    else:
+                        batch = pending
+                        results.extend(skipped)
+                        if not batch:
+                            continue
+
+                stem_map = await asyncio.to_thread(self._translate_filenames, batch)
+                for source_file in batch:
+                    await file_queue.put((source_file, stem_map[source_file]))
+        except Exception as e:
+            logger.error("Failed to find Markdown files: %s", e)
+        finally:
+            # Files already queued are still translated
+            await file_queue.put(None)
 
-    def _translate_single_file(
+        return found_count
+
+    async def _reader(
         self,
-        source_file: Path,
+        file_queue: asyncio.Queue[_FileItem],
+        read_queue: asyncio.Queue[_ContentItem],
         source_dir: Path,
-        output_dir_name: str = "jp"
-    ) -> TranslationResult:
+        results: list[TranslationResult]
+    ) -> None:
         """
-        Translate a single Markdown file.
+        Read queued files and pass their content on to the translators.
+
+        Reading the next file overlaps with the API calls for earlier ones.
+        One None sentinel per translator is queued when done.
 
         Args:
-            source_file: Path to the source file
-            source_dir: Source directory (for creating output path)
-            output_dir_name: Name of the output directory (default: "jp")
+            file_queue: Queue of (source file, translated stem) pairs
+            read_queue: Queue that (source file, translated stem, content) records are put on
+            source_dir: Source directory (for log messages)
+            results: List that failed results are appended to
+        """
+        while True:
+            item = await file_queue.get()
+            if item is None:
+                break
+
+            source_file, translated_stem = item
+            logger.info("Processing: %s", source_file.relative_to(source_dir))
+            try:
+                content = await self.file_service.read_file_async(source_file)
+            except Exception as e:
+                results.append(self._failed(source_file, source_dir, e))
+                continue
+
+            await read_queue.put((source_file, translated_stem, content))
+
+        for _ in range(self.concurrency):
+            await read_queue.put(None)
+
+    async def _translator(
+        self,
+        read_queue: asyncio.Queue[_ContentItem],
+        write_queue: asyncio.Queue[_ContentItem],
+        source_dir: Path,
+        results: list[TranslationResult]
+    ) -> None:
+        """
+        Translate file contents until a None sentinel is received.
+
+        With batch_size above 1, files already waiting on the queue are
+        translated together in one request. A None sentinel is passed on to
+        the writer when done.
+
+        Args:
+            read_queue: Queue of (source file, translated stem, content) records
+            write_queue: Queue that (source file, translated stem, translated content)
+                records are put on
+            source_dir: Source directory (for log messages)
+            results: List that failed results are appended to
+        """
+        finished = False
+        carried: _ContentItem = None
+        while not finished:
+            item = carried if carried is not None else await read_queue.get()
+            carried = None
+            if item is None:
+                break
+
+            batch = [item]
+            chars = len(item[2])
+            # Only take files that are already read so batching never delays a translation
+            while len(batch) < self.batch_size and not read_queue.empty():
+                item = read_queue.get_nowait()
+                if item is None:
+                    finished = True
+                    break
+                if chars + len(item[2]) > self.translation_service.max_chunk_chars:
+                    # Adding this file would overflow the request; it starts the next batch
+                    carried = item
+                    break
+                batch.append(item)
+                chars += len(item[2])
+
+            translated_contents = await self._translate_contents([content for _, _, content in batch])
+            for (source_file, translated_stem, _), translated in zip(batch, translated_contents):
+                if isinstance(translated, BaseException):
+                    results.append(self._failed(source_file, source_dir, translated))
+                else:
+                    await write_queue.put((source_file, translated_stem, translated))
+
+        await write_queue.put(None)
+
+    async def _translate_contents(self, contents: list[str]) -> Sequence[Union[str, BaseException]]:
+        """
+        Translate file contents, combining several files into one request.
+
+        If the combined request fails, the files are translated individually so
+        that errors are reported per file.
+
+        Args:
+            contents: Markdown contents to translate
 
         Returns:
-            TranslationResult: Result of the translation
+            Sequence[Union[str, BaseException]]: Translated content, or the exception
+                raised, for each input
         """
-        print(f"[INFO] Processing: {source_file.relative_to(source_dir)}")
+        if len(contents) > 1:
+            try:
+                return await asyncio.to_thread(self.translation_service.translate_batch, contents)
+            except Exception as e:
+                logger.warning("Batch translation failed, translating files individually: %s", e)
 
-        try:
-            # Read the source file
-            content = self.file_service.read_file(source_file)
+        return await asyncio.gather(
+            *(self.translation_service.translate_markdown_async(content) for content in contents),
+            return_exceptions=True
+        )
 
-            # Translate the content
-            translated_content = self.translation_service.translate_markdown(content)
+    async def _writer(
+        self,
+        write_queue: asyncio.Queue[_ContentItem],
+        source_dir: Path,
+        output_dir_name: str,
+        results: list[TranslationResult]
+    ) -> None:
+        """
+        Write translated files until every translator has finished.
 
-            # Translate the filename (without extension)
-            original_stem = source_file.stem
+        Args:
+            write_queue: Queue of (source file, translated stem, translated content) records
+            source_dir: Source directory (for creating output paths)
+            output_dir_name: Name of the output directory
+            results: List that translation results are appended to
+        """
+        remaining = self.concurrency
+        while remaining:
+            item = await write_queue.get()
+            if item is None:
+                remaining -= 1
+                continue
+
+            source_file, translated_stem, translated_content = item
             try:
-                # Translate filename using the translation service's API client
-                translated_stem = self.translation_service.api_client.translate_text(
-                    original_stem,
-                    target_language="Japanese"
+                # Create output path with translated filename
+                output_path = self.file_service.create_output_path(
+                    source_file,
+                    source_dir,
+                    output_dir_name=output_dir_name
                 )
-                # Clean up the translated filename (remove special characters that are invalid in filenames)
-                translated_stem = translated_stem.replace('/', '_').replace('\\', '_').replace(':', '_')
+                output_path = output_path.parent / f"{translated_stem}.md"
+
+                await self.file_service.write_file_async(output_path, translated_content)
             except Exception as e:
-                # If filename translation fails, use original filename
-                print(f"[WARNING] Failed to translate filename, using original: {e}")
-                translated_stem = original_stem
+                results.append(self._failed(source_file, source_dir, e))
+                continue
 
-            # Create output path with translated filename
-            output_path = self.file_service.create_output_path(
-                source_file,
-                source_dir,
-                output_dir_name=output_dir_name
+            logger.info(
+                "Successfully translated: %s -> %s",
+                source_file.relative_to(source_dir),
+                output_path.relative_to(source_dir)
             )
+            results.append(TranslationResult(source_file=source_file, success=True, output_file=output_path))
 
-            # Replace the filename with translated version
-            output_path = output_path.parent / f"{translated_stem}.md"
+    def _skip_unchanged(
+        self,
+        batch: list[Path],
+        source_dir: Path,
+        index: TranslationIndex,
+        stat_keys: dict[Path, tuple[int, int]]
+    ) -> tuple[list[Path], list[TranslationResult]]:
+        """
+        Separate files that are unchanged since the last run from those that need translating.
 
-            # Write the translated content
-            self.file_service.write_file(output_path, translated_content)
+        Args:
+            batch: Candidate Markdown files
+            source_dir: Source directory (for log messages)
+            index: Index of previously translated files
+            stat_keys: Dict that the (mtime_ns, size) of each file to translate is stored in
 
-            print(f"[INFO] Successfully translated: {source_file.relative_to(source_dir)} -> {output_path.relative_to(source_dir)}")
-            return TranslationResult(
-                source_file=source_file,
-                success=True
-            )
+        Returns:
+            tuple[list[Path], list[TranslationResult]]: Files to translate, and
+                results for the skipped files
+        """
+        pending = []
+        skipped = []
+        for source_file in batch:
+            try:
+                key = TranslationIndex.stat_key(source_file)
+            except OSError:
+                # Let the normal read path report the error
+                pending.append(source_file)
+                continue
+
+            if index.is_unchanged(source_file, key):
+                logger.info("Skipping unchanged: %s", source_file.relative_to(source_dir))
+                skipped.append(TranslationResult(source_file=source_file, success=True, cached=True))
+            else:
+                stat_keys[source_file] = key
+                pending.append(source_file)
+
+        return pending, skipped
+
+    def _translate_filenames(self, markdown_files: list[Path]) -> dict[Path, str]:
+        """
+        Translate the filenames of a batch of Markdown files in one API call.
+
+        Args:
+            markdown_files: Markdown files whose filenames should be translated
+
+        Returns:
+            dict[Path, str]: Mapping of source file to translated, filesystem-safe
+                stem. Falls back to the original stems if translation fails.
+        """
+        # Translate each distinct stem only once
+        stems = list(dict.fromkeys(f.stem for f in markdown_files))
 
+        try:
+            translated = self.translation_service.translate_filenames(stems)
+            # Clean up the translated filenames (remove special characters that are invalid in filenames)
+            translated_stems = {
+                stem: translated_stem.replace('/', '_').replace('\\', '_').replace(':', '_')
+                for stem, translated_stem in zip(stems, translated)
+            }
         except Exception as e:
-            # Log the error and continue processing
-            error_msg = str(e)
-            print(f"[ERROR] Failed to translate file: {source_file.relative_to(source_dir)}")
-            print(f"Reason: {error_msg}")
-
-            return TranslationResult(
-                source_file=source_file,
-                success=False,
-                error_message=error_msg
-            )
+            # If filename translation fails, use original filenames
+            logger.warning("Failed to translate filenames, using originals: %s", e)
+            translated_stems = {stem: stem for stem in stems}
+
+        return {f: translated_stems[f.stem] for f in markdown_files}
+
+    @staticmethod
+    def _failed(source_file: Path, source_dir: Path, error: BaseException) -> TranslationResult:
+        """
+        Log a failed translation and build its result.
+
+        Args:
+            source_file: Path to the source file
+            source_dir: Source directory (for log messages)
+            error: Exception raised while processing the file
+
+        Returns:
+            TranslationResult: Failed result carrying the error message
+        """
+        error_msg = str(error)
+        logger.error("Failed to translate file: %s\nReason: %s", source_file.relative_to(source_dir), error_msg)
+        return TranslationResult(source_file=source_file, success=False, error_message=error_msg)
 
     def print_summary(self, results: list[TranslationResult]) -> None:
         """
@@ -160,12 +517,15 @@ class TranslationOrchestrator:
 
         successful = [r for r in results if r.success]
         failed = [r for r in results if not r.success]
+        unchanged = [r for r in successful if r.cached]
 
         print("\n" + "=" * 60)
         print("TRANSLATION SUMMARY")
         print("=" * 60)
         print(f"Total files: {len(results)}")
         print(f"Successful: {len(successful)}")
+        if unchanged:
+            print(f"  Skipped (unchanged): {len(unchanged)}")
         print(f"Failed: {len(failed)}")
 
         if failed:
@@ -0,0 +1,50 @@
+"""Client-side request rate limiting for the Markdown Translator."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket that spaces out requests to a fixed rate."""
+
+    def __init__(self, requests_per_minute: float):
+        """
+        Create a bucket that starts full.
+
+        The bucket holds up to one second's worth of requests (at least one),
+        so short bursts are allowed but the long-run rate never exceeds
+        requests_per_minute.
+
+        Args:
+            requests_per_minute: Maximum sustained request rate
+
+        Raises:
+            ValueError: If requests_per_minute is not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.rate = requests_per_minute / 60.0  # Tokens per second
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Take one token, sleeping until it is available.
+
+        Tokens are reserved under the lock and the sleep happens outside it,
+        so waiting callers are served in arrival order without blocking each
+        other's bookkeeping.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance is the time still owed for this caller's token
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
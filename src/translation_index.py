@@ -0,0 +1,129 @@
+"""Sidecar index used to skip unchanged files between translation runs."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".jp_translate_index.json"
+
+
+class TranslationIndex:
+    """
+    Record of previously translated files keyed by their path relative to the source directory.
+
+    Each entry stores the source file's modification time and size at the time
+    it was translated, together with the output file that was written. A file
+    is considered unchanged when both values still match and the output file
+    still exists.
+    """
+
+    def __init__(self, source_dir: Path, index_path: Optional[Path] = None):
+        """
+        Load the index for a source directory.
+
+        A missing or unreadable index, or one that is not a JSON object, is
+        treated as empty. Entries that are not objects are dropped.
+
+        Args:
+            source_dir: Source directory the index belongs to
+            index_path: Index file location (default: source_dir / INDEX_FILENAME)
+        """
+        self.source_dir = source_dir
+        self.index_path = index_path or source_dir / INDEX_FILENAME
+        self._entries: dict[str, dict] = {}
+
+        try:
+            # json.loads decodes UTF-8 bytes itself, skipping a separate text decode
+            data = json.loads(self.index_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable translation index %s: %s", self.index_path, e)
+            return
+
+        if not isinstance(data, dict):
+            logger.warning("Ignoring malformed translation index %s: not a JSON object", self.index_path)
+            return
+
+        self._entries = {path: entry for path, entry in data.items() if isinstance(entry, dict)}
+        if len(self._entries) != len(data):
+            logger.warning(
+                "Ignoring %d malformed entries in translation index %s",
+                len(data) - len(self._entries),
+                self.index_path
+            )
+
+    @staticmethod
+    def stat_key(source_file: Path) -> tuple[int, int]:
+        """
+        Get the (mtime_ns, size) pair used to detect changes.
+
+        Args:
+            source_file: Source file to stat
+
+        Returns:
+            tuple[int, int]: Modification time in nanoseconds and size in bytes
+
+        Raises:
+            OSError: If the file cannot be stat'ed
+        """
+        st = source_file.stat()
+        return st.st_mtime_ns, st.st_size
+
+    def is_unchanged(self, source_file: Path, key: tuple[int, int]) -> bool:
+        """
+        Check whether a file is unchanged since it was last translated.
+
+        Args:
+            source_file: Source file path
+            key: Current (mtime_ns, size) of the source file
+
+        Returns:
+            bool: True if the file matches the index and its output still exists
+        """
+        entry = self._entries.get(self._relative(source_file))
+        if not entry or (entry.get("mtime_ns"), entry.get("size")) != key:
+            return False
+
+        output = entry.get("output")
+        return isinstance(output, str) and (self.source_dir / output).exists()
+
+    def record(self, source_file: Path, key: tuple[int, int], output_file: Path) -> None:
+        """
+        Record a successful translation.
+
+        Args:
+            source_file: Source file path
+            key: (mtime_ns, size) of the source file before it was read
+            output_file: Path of the translated output file
+        """
+        self._entries[self._relative(source_file)] = {
+            "mtime_ns": key[0],
+            "size": key[1],
+            "output": self._relative(output_file),
+        }
+
+    def save(self) -> None:
+        """
+        Atomically write the index back to disk.
+
+        Failures are reported as warnings; a missing index only means the next
+        run translates everything again.
+        """
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            # Compact separators keep the index small for large trees
+            data = json.dumps(self._entries, ensure_ascii=False, separators=(",", ":"))
+            tmp_path.write_bytes(data.encode("utf-8"))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning("Failed to save translation index %s: %s", self.index_path, e)
+
+    def _relative(self, path: Path) -> str:
+        """Return path relative to the source directory in POSIX form."""
+        return path.relative_to(self.source_dir).as_posix()
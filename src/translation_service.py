@@ -1,26 +1,140 @@
 """Translation service for Markdown content."""
 
+import asyncio
 import re
 from .api_client import GeminiAPIClient
 from .exceptions import TranslationError
 
 
+# Continuation lines of a footnote definition are indented by four spaces or a tab
+_FOOTNOTE_CONTINUATION_PREFIXES = ('    ', '\t')
+
+# Placeholders substituted for footnotes during translation: __FOOTNOTE_<index>__
+_PLACEHOLDER_RE = re.compile(r'__FOOTNOTE_(\d+)__')
+
+# Opening/closing lines of fenced code blocks
+_FENCE_PREFIXES = ('```', '~~~')
+
+# Single-pass scanner over preprocessed content for the translatable-text check:
+# fenced code blocks (from an opening ``` or ~~~ line to the next fence line or the
+# end) and footnote placeholders are consumed whole, so only letters outside them
+# (a letter is a word character that is not a digit or underscore) match `letter`
+_PROSE_SCANNER_RE = re.compile(
+    # A fence opener is a whole line; a ``` opener's info string cannot contain backticks,
+    # so inline code such as "```bash``` is the tag" stays prose
+    r'(?P<code>^[^\S\n]*(?:```[^`\n]*|~~~[^\n]*)$.*?(?:^[^\S\n]*(?:```|~~~)[^\n]*$|\Z))'
+    r'|(?P<placeholder>__FOOTNOTE_\d+__)'
+    r'|(?P<letter>[^\W\d_])',
+    re.MULTILINE | re.DOTALL
+)
+
+# Sent with filename batches so the response keeps one translated stem per input line
+_FILENAME_INSTRUCTION = (
+    "The text is a list of file names, one per line. Return exactly one translated "
+    "file name per line, in the same order, with the same number of lines. "
+    "Do not merge, split, number or reorder lines."
+)
+
+# Documents translated together are wrapped in <<<S<index>>> ... <<<E<index>>> markers;
+# the instruction goes in the system instruction so it cannot leak into a section
+_BATCH_INSTRUCTION = (
+    "The text contains several documents, each between a <<<S<number>>> line and "
+    "a <<<E<number>>> line. Translate each document separately and keep every "
+    "marker line unchanged."
+)
+_BATCH_SECTION_RE = re.compile(r'<<<S(\d+)>>>\n?(.*?)\n?<<<E\1>>>', re.DOTALL)
+
+
+def _is_footnote_definition(line: str) -> bool:
+    """
+    Check whether a line is a footnote definition, "[^id]: text", optionally indented.
+
+    Args:
+        line: A single line without its newline
+
+    Returns:
+        bool: True if the line starts a footnote definition with non-blank text
+    """
+    stripped = line.lstrip()
+    if not stripped.startswith('[^'):
+        return False
+    close = stripped.find(']', 2)
+    return close > 2 and stripped[close + 1:close + 2] == ':' and bool(stripped[close + 2:].strip())
+
+
+def _extract_footnotes(content: str) -> tuple[str, list[str]]:
+    """
+    Replace each footnote definition with a numbered placeholder.
+
+    A definition extends over the following non-blank lines indented by four
+    spaces or a tab that do not start another definition.
+
+    Args:
+        content: Markdown content
+
+    Returns:
+        tuple[str, list[str]]: (content with placeholders, extracted footnotes)
+    """
+    lines = content.split('\n')
+    output = []
+    footnotes: list[str] = []
+
+    # Single forward pass over the lines; the cheap substring test skips the
+    # definition check for almost every line
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if '[^' not in line or not _is_footnote_definition(line):
+            output.append(line)
+            i += 1
+            continue
+
+        end = i + 1
+        while end < len(lines):
+            candidate = lines[end]
+            if not (candidate.startswith(_FOOTNOTE_CONTINUATION_PREFIXES) and candidate.strip()) \
+                    or _is_footnote_definition(candidate):
+                break
+            end += 1
+
+        footnotes.append('\n'.join(lines[i:end]))
+        output.append(f"__FOOTNOTE_{len(footnotes) - 1}__")
+        i = end
+
+    return '\n'.join(output), footnotes
+
+
 class TranslationService:
     """Service for translating Markdown content while preserving formatting."""
 
-    def __init__(self, api_client: GeminiAPIClient):
+    def __init__(
+        self,
+        api_client: GeminiAPIClient,
+        max_chunk_chars: int = 20000,
+        min_translatable_chars: int = 1
+    ):
         """
         Initialize the translation service.
 
         Args:
             api_client: GeminiAPIClient instance for translation
+            max_chunk_chars: Documents longer than this are split at level-2
+                headings into chunks of roughly this size (default: 20000)
+            min_translatable_chars: Documents with fewer letters than this
+                outside code blocks and footnotes are returned unchanged
+                without an API call (default: 1)
         """
         self.api_client = api_client
+        self.max_chunk_chars = max_chunk_chars
+        self.min_translatable_chars = min_translatable_chars
 
     def translate_markdown(self, content: str) -> str:
         """
         Translate Markdown content to Japanese.
 
+        Large documents are split into sections that are translated one after
+        another.
+
         Args:
             content: Markdown content to translate
 
@@ -34,23 +148,263 @@ class TranslationService:
             return content
 
         try:
-            # Step 1: Preprocess - extract footnotes
+            # Step 1: Preprocess - extract footnotes from the whole document
             processed_content, footnotes = self.preprocess_markdown(content)
+            if not self._has_translatable_text(processed_content):
+                return content
 
-            # Step 2: Translate the processed content
-            translated_content = self.api_client.translate_text(
-                processed_content,
-                target_language="Japanese"
-            )
+            # Step 2: Translate the processed content section by section
+            chunks = self._split_sections(processed_content)
+            translated_chunks = [
+                self.api_client.translate_text(chunk, target_language="Japanese")
+                for chunk in chunks
+            ]
 
             # Step 3: Postprocess - restore footnotes
-            final_content = self.postprocess_markdown(translated_content, footnotes)
+            final_content = self.postprocess_markdown(
+                self._join_sections(chunks, translated_chunks),
+                footnotes
+            )
 
             return final_content
 
         except Exception as e:
             raise TranslationError(f"Failed to translate markdown: {e}")
 
+    async def translate_markdown_async(self, content: str) -> str:
+        """
+        Translate Markdown content to Japanese, translating sections concurrently.
+
+        Args:
+            content: Markdown content to translate
+
+        Returns:
+            str: Translated Markdown content
+
+        Raises:
+            TranslationError: If translation fails
+        """
+        if not content or not content.strip():
+            return content
+
+        try:
+            # Footnotes are extracted from the whole document so placeholders
+            # inside any section resolve after reassembly
+            processed_content, footnotes = self.preprocess_markdown(content)
+            if not self._has_translatable_text(processed_content):
+                return content
+
+            chunks = self._split_sections(processed_content)
+            translated_chunks = await asyncio.gather(*(
+                asyncio.to_thread(
+                    self.api_client.translate_text,
+                    chunk,
+                    target_language="Japanese"
+                )
+                for chunk in chunks
+            ))
+
+            return self.postprocess_markdown(
+                self._join_sections(chunks, translated_chunks),
+                footnotes
+            )
+
+        except Exception as e:
+            raise TranslationError(f"Failed to translate markdown: {e}")
+
+    def translate_batch(self, contents: list[str]) -> list[str]:
+        """
+        Translate several Markdown documents to Japanese in a single API call.
+
+        The documents are sent wrapped in numbered markers, explained in a system
+        instruction, and the response is split back apart on the same markers.
+        Each document keeps its own trailing whitespace. Documents without translatable
+        text are returned unchanged, and documents longer than max_chunk_chars are translated on
+        their own with translate_markdown.
+
+        Args:
+            contents: Markdown documents to translate
+
+        Returns:
+            list[str]: Translated documents in the same order as the input
+
+        Raises:
+            TranslationError: If translation fails or the response does not
+                contain every section
+        """
+        translated = list(contents)
+        batched = []
+        for i, content in enumerate(contents):
+            if not content.strip():
+                continue
+            if len(content) > self.max_chunk_chars:
+                translated[i] = self.translate_markdown(content)
+                continue
+
+            processed_content, footnotes = self.preprocess_markdown(content)
+            if self._has_translatable_text(processed_content):
+                batched.append((i, processed_content, footnotes))
+
+        if len(batched) == 1:
+            i = batched[0][0]
+            translated[i] = self.translate_markdown(contents[i])
+        elif batched:
+            prompt = "\n".join(
+                f"<<<S{n}>>>\n{processed_content}\n<<<E{n}>>>"
+                for n, (_, processed_content, _) in enumerate(batched)
+            )
+
+            try:
+                response = self.api_client.translate_text(
+                    prompt,
+                    target_language="Japanese",
+                    instruction=_BATCH_INSTRUCTION
+                )
+            except Exception as e:
+                raise TranslationError(f"Failed to translate batch: {e}")
+
+            sections = {int(m.group(1)): m.group(2) for m in _BATCH_SECTION_RE.finditer(response)}
+            if sections.keys() != set(range(len(batched))):
+                raise TranslationError(
+                    f"Expected {len(batched)} translated sections, got {len(sections)}"
+                )
+
+            for n, (i, processed_content, footnotes) in enumerate(batched):
+                # The model does not reliably keep whitespace next to the markers, so
+                # give each document back its own trailing whitespace (e.g. the final newline)
+                trailing = processed_content[len(processed_content.rstrip()):]
+                translated[i] = self.postprocess_markdown(sections[n].rstrip() + trailing, footnotes)
+
+        return translated
+
+    def _has_translatable_text(self, processed_content: str) -> bool:
+        """
+        Check whether preprocessed content has enough prose to be worth translating.
+
+        Fenced code blocks and footnote placeholders are ignored, so code-only
+        documents or tables of numbers skip the API call entirely.
+
+        Args:
+            processed_content: Content with footnotes replaced by placeholders
+
+        Returns:
+            bool: True if at least min_translatable_chars letters remain
+        """
+        if self.min_translatable_chars <= 0:
+            return True
+
+        letters = 0
+        for match in _PROSE_SCANNER_RE.finditer(processed_content):
+            if match.lastgroup == 'letter':
+                letters += 1
+                # Stop scanning as soon as enough letters have been seen
+                if letters >= self.min_translatable_chars:
+                    return True
+        return False
+
+    def _split_sections(self, content: str) -> list[str]:
+        """
+        Split Markdown content into chunks at level-2 headings.
+
+        Content no longer than max_chunk_chars is returned as a single chunk.
+        Otherwise the document is split before each `## ` heading outside of
+        fenced code blocks, and adjacent sections are packed together while they
+        fit within max_chunk_chars. A single oversized section is kept whole.
+
+        Args:
+            content: Markdown content to split
+
+        Returns:
+            list[str]: Chunks that concatenate back to the original content
+        """
+        if len(content) <= self.max_chunk_chars:
+            return [content]
+
+        sections: list[str] = []
+        current: list[str] = []
+        in_fence = False
+        for line in content.splitlines(keepends=True):
+            stripped = line.lstrip()
+            if stripped.startswith(_FENCE_PREFIXES):
+                in_fence = not in_fence
+            elif not in_fence and line.startswith('## ') and current:
+                sections.append(''.join(current))
+                current = []
+            current.append(line)
+        if current:
+            sections.append(''.join(current))
+
+        chunks = []
+        buffer = ''
+        for section in sections:
+            if buffer and len(buffer) + len(section) > self.max_chunk_chars:
+                chunks.append(buffer)
+                buffer = section
+            else:
+                buffer += section
+        if buffer:
+            chunks.append(buffer)
+
+        return chunks
+
+    @staticmethod
+    def _join_sections(chunks: list[str], translated_chunks: list[str]) -> str:
+        """
+        Reassemble translated chunks into a single document.
+
+        translate_text strips surrounding whitespace, so each translated chunk
+        gets back the trailing whitespace of its source chunk (the blank lines
+        before the next section and the final newline).
+
+        Args:
+            chunks: Source chunks from _split_sections
+            translated_chunks: Translated chunks in document order
+
+        Returns:
+            str: Joined Markdown content
+        """
+        return ''.join(
+            translated.rstrip() + chunk[len(chunk.rstrip()):]
+            for chunk, translated in zip(chunks, translated_chunks)
+        )
+
+    def translate_filenames(self, stems: list[str]) -> list[str]:
+        """
+        Translate a list of filename stems to Japanese in a single API call.
+
+        The stems are sent one per line, with a system instruction asking for
+        exactly one translation per line in the same order.
+
+        Args:
+            stems: Filename stems (without extension) to translate
+
+        Returns:
+            list[str]: Translated stems in the same order as the input
+
+        Raises:
+            TranslationError: If translation fails or the response does not
+                contain exactly one line per stem
+        """
+        if not stems:
+            return []
+
+        try:
+            translated = self.api_client.translate_text(
+                "\n".join(stems),
+                target_language="Japanese",
+                instruction=_FILENAME_INSTRUCTION
+            )
+        except Exception as e:
+            raise TranslationError(f"Failed to translate filenames: {e}")
+
+        lines = [line.strip() for line in translated.splitlines() if line.strip()]
+        if len(lines) != len(stems):
+            raise TranslationError(
+                f"Expected {len(stems)} translated filenames, got {len(lines)}"
+            )
+
+        return lines
+
     def preprocess_markdown(self, content: str) -> tuple[str, list[str]]:
         """
         Preprocess Markdown content by extracting footnotes.
@@ -64,59 +418,7 @@ class TranslationService:
         Returns:
             tuple[str, list[str]]: (processed content, extracted footnotes)
         """
-        footnotes = []
-
-        # Pattern to match footnote definitions: [^id]: text
-        # This matches from [^...]: to the end of the line or until a blank line
-        footnote_def_pattern = r'^\[\^[^\]]+\]:\s*.+$'
-
-        lines = content.split('\n')
-        processed_lines = []
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
-
-            # Check if this line is a footnote definition
-            if re.match(footnote_def_pattern, line.strip()):
-                # Collect the footnote definition (may span multiple lines)
-                footnote_lines = [line]
-                i += 1
-
-                # Continue collecting lines that are part of the footnote
-                # (indented lines or lines that continue the definition)
-                while i < len(lines):
-                    next_line = lines[i]
-
-                    # If the next line is empty, it marks the end of the footnote
-                    if not next_line.strip():
-                        break
-
-                    # If the next line starts with a new footnote definition, stop
-                    if re.match(footnote_def_pattern, next_line.strip()):
-                        break
-
-                    # If the line is indented (part of the footnote), include it
-                    if next_line.startswith('    ') or next_line.startswith('\t'):
-                        footnote_lines.append(next_line)
-                        i += 1
-                    else:
-                        # Not part of the footnote anymore
-                        break
-
-                # Store the complete footnote
-                footnote_text = '\n'.join(footnote_lines)
-                footnotes.append(footnote_text)
-
-                # Replace with a placeholder
-                placeholder = f"__FOOTNOTE_{len(footnotes) - 1}__"
-                processed_lines.append(placeholder)
-            else:
-                processed_lines.append(line)
-                i += 1
-
-        processed_content = '\n'.join(processed_lines)
-        return processed_content, footnotes
+        return _extract_footnotes(content)
 
     def postprocess_markdown(
         self,
@@ -136,11 +438,10 @@ class TranslationService:
         if not footnotes:
             return translated_content
 
-        result = translated_content
-
-        # Replace placeholders with original footnotes
-        for i, footnote in enumerate(footnotes):
-            placeholder = f"__FOOTNOTE_{i}__"
-            result = result.replace(placeholder, footnote)
+        def restore(match: re.Match) -> str:
+            index = int(match.group(1))
+            # Leave placeholders that do not refer to an extracted footnote untouched
+            return footnotes[index] if index < len(footnotes) else match.group(0)
 
-        return result
+        # Replace all placeholders with original footnotes in a single pass
+        return _PLACEHOLDER_RE.sub(restore, translated_content)
@@ -0,0 +1,58 @@
+"""Shared pytest fixtures."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.exceptions import APIError, RateLimitError
+from tests.fakes import FakeGeminiAPIClient
+from tests.helpers import write_text_fast
+
+
+# Files of the markdown test tree, including one non-markdown file
+MD_TREE_FILES = (
+    ("README.md", "# Root README"),
+    (os.path.join("docs", "guide.md"), "# Guide"),
+    (os.path.join("docs", "nested", "deep.md"), "# Deep"),
+    ("test.txt", "Not markdown"),
+)
+
+
+@pytest.fixture
+def fake_api() -> FakeGeminiAPIClient:
+    """Fake API client that echoes its input, so filenames stay unchanged."""
+    return FakeGeminiAPIClient()
+
+
+@pytest.fixture
+def fake_api_failing() -> FakeGeminiAPIClient:
+    """Fake API client whose every request fails with an API error."""
+    def fail(text: str) -> str:
+        raise APIError("API connection failed")
+
+    return FakeGeminiAPIClient(fail)
+
+
+@pytest.fixture
+def fake_api_rate_limited() -> FakeGeminiAPIClient:
+    """Fake API client whose every request hits the rate limit."""
+    def rate_limited(text: str) -> str:
+        raise RateLimitError("Rate limit exceeded")
+
+    return FakeGeminiAPIClient(rate_limited)
+
+
+@pytest.fixture(scope="session")
+def md_tree_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Markdown source tree built once per session.
+
+    Read-only: tests that need the tree take a copy of it.
+    """
+    root = str(tmp_path_factory.mktemp("md_template"))
+    os.makedirs(os.path.join(root, "docs", "nested"))
+    for relative_path, text in MD_TREE_FILES:
+        write_text_fast(os.path.join(root, relative_path), text)
+
+    return Path(root)
@@ -0,0 +1,29 @@
+"""Lightweight test doubles shared by the test suite."""
+
+from typing import Callable
+
+
+class FakeGeminiAPIClient:
+    """
+    Stand-in for GeminiAPIClient that translates with a plain function.
+
+    Cheaper to build than Mock(spec=GeminiAPIClient), which inspects the real
+    class on every instantiation. Every text passed to translate_text is
+    recorded in `calls`.
+    """
+
+    def __init__(self, translate: Callable[[str], str] = lambda text: text):
+        """
+        Create the fake client.
+
+        Args:
+            translate: Function applied to each text; may raise to simulate
+                API failures (default: echo the text unchanged)
+        """
+        self.translate = translate
+        self.calls: list[str] = []
+
+    def translate_text(self, text: str, target_language: str = "Japanese", instruction: str = "") -> str:
+        """Record the text and return the result of the translate function."""
+        self.calls.append(text)
+        return self.translate(text)
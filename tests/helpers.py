@@ -0,0 +1,19 @@
+"""Small helpers shared by the test suite."""
+
+import os
+from pathlib import Path
+from typing import Union
+
+
+def write_text_fast(path: Union[str, Path], text: str) -> None:
+    """
+    Write test scaffolding with raw file descriptor calls.
+
+    Skips the text-layer setup and extra syscalls of Path.write_text; meant
+    for fixture files only, not for checking the code under test.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
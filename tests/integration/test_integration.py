@@ -1,14 +1,20 @@
 """Integration tests for all components working together."""
 
+import asyncio
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-from src.api_client import GeminiAPIClient
 from src.file_service import FileSystemService
 from src.translation_service import TranslationService
 from src.orchestrator import TranslationOrchestrator, TranslationResult
 from src.exceptions import APIError, RateLimitError, TranslationError
+from tests.fakes import FakeGeminiAPIClient
+
+
+def translate_lines(text):
+    """Fake translation that marks every non-blank line, keeping the line layout."""
+    return "\n".join(f"[翻訳済み] {line}" if line.strip() else line for line in text.split("\n"))
 
 
 class TestComponentIntegration:
@@ -40,13 +46,12 @@ class TestComponentIntegration:
         (source_dir / "api" / "reference.md").write_text(api_content)
         (source_dir / "api" / "v1" / "spec.md").write_text(v1_content)
 
-        # Mock API client
-        mock_api_client = Mock(spec=GeminiAPIClient)
-        mock_api_client.translate_text.side_effect = lambda text, **kwargs: f"[翻訳済み] {text}"
+        # Fake API client
+        api_client = FakeGeminiAPIClient(translate_lines)
 
         # Initialize components
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(api_client)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         # Execute translation
@@ -56,21 +61,21 @@ class TestComponentIntegration:
         assert len(results) == 4
         assert all(r.success for r in results)
 
-        # Verify directory structure is preserved
+        # Verify directory structure is preserved under the translated filenames
         output_dir = source_dir / "jp"
         assert output_dir.exists()
-        assert (output_dir / "README.md").exists()
-        assert (output_dir / "guide" / "user-guide.md").exists()
-        assert (output_dir / "api" / "reference.md").exists()
-        assert (output_dir / "api" / "v1" / "spec.md").exists()
+        assert (output_dir / "[翻訳済み] README.md").exists()
+        assert (output_dir / "guide" / "[翻訳済み] user-guide.md").exists()
+        assert (output_dir / "api" / "[翻訳済み] reference.md").exists()
+        assert (output_dir / "api" / "v1" / "[翻訳済み] spec.md").exists()
 
         # Verify content was translated
-        translated_readme = (output_dir / "README.md").read_text()
+        translated_readme = (output_dir / "[翻訳済み] README.md").read_text()
         assert "[翻訳済み]" in translated_readme
         assert "README" in translated_readme
 
-        # Verify API was called for each file
-        assert mock_api_client.translate_text.call_count == 4
+        # Verify API was called once per file plus once for the filename batch
+        assert len(api_client.calls) == 5
 
     def test_integration_with_footnotes_preservation(self, tmp_path):
         """
@@ -94,20 +99,18 @@ Another paragraph with another footnote[^note].
 
         (source_dir / "doc.md").write_text(content_with_footnotes)
 
-        # Mock API client - should not receive footnotes
-        mock_api_client = Mock(spec=GeminiAPIClient)
-
-        def mock_translate(text, **kwargs):
+        # Fake API client - should not receive footnotes
+        def fake_translate(text):
             # Verify footnotes are not in the text sent to API
             assert "[^1]:" not in text
             assert "[^note]:" not in text
-            return f"[翻訳済み] {text}"
+            return translate_lines(text)
 
-        mock_api_client.translate_text.side_effect = mock_translate
+        api_client = FakeGeminiAPIClient(fake_translate)
 
         # Initialize and execute
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(api_client)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -117,7 +120,7 @@ Another paragraph with another footnote[^note].
         assert results[0].success
 
         # Verify footnotes are in the output
-        output_file = source_dir / "jp" / "doc.md"
+        output_file = source_dir / "jp" / "[翻訳済み] doc.md"
         translated_content = output_file.read_text()
         assert "[^1]:" in translated_content
         assert "[^note]:" in translated_content
@@ -136,22 +139,17 @@ Another paragraph with another footnote[^note].
         (source_dir / "file2.md").write_text("# File 2")
         (source_dir / "file3.md").write_text("# File 3")
 
-        # Mock API client that fails on second file
-        mock_api_client = Mock(spec=GeminiAPIClient)
-        call_count = 0
-
-        def mock_translate(text, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 2:
+        # Fake API client that fails on the content of file 2
+        def fake_translate(text):
+            if text == "# File 2":
                 raise APIError("API failed for file 2")
-            return f"[翻訳済み] {text}"
+            return translate_lines(text)
 
-        mock_api_client.translate_text.side_effect = mock_translate
+        api_client = FakeGeminiAPIClient(fake_translate)
 
         # Initialize and execute
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(api_client)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -172,10 +170,11 @@ Another paragraph with another footnote[^note].
 
         # Verify successful files were written
         output_dir = source_dir / "jp"
-        assert (output_dir / "file1.md").exists()
-        assert (output_dir / "file3.md").exists()
+        assert (output_dir / "[翻訳済み] file1.md").exists()
+        assert (output_dir / "[翻訳済み] file3.md").exists()
+        assert not (output_dir / "[翻訳済み] file2.md").exists()
 
-    def test_integration_with_empty_directory(self, tmp_path):
+    def test_integration_with_empty_directory(self, tmp_path, fake_api):
         """
         Test handling of directory with no markdown files.
 
@@ -188,12 +187,9 @@ Another paragraph with another footnote[^note].
         (source_dir / "readme.txt").write_text("Not a markdown file")
         (source_dir / "data.json").write_text("{}")
 
-        # Mock API client (should not be called)
-        mock_api_client = Mock(spec=GeminiAPIClient)
-
-        # Initialize and execute
+        # Initialize and execute (the API client should not be called)
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(fake_api)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -202,7 +198,7 @@ Another paragraph with another footnote[^note].
         assert len(results) == 0
 
         # Verify API was never called
-        mock_api_client.translate_text.assert_not_called()
+        assert fake_api.calls == []
 
     def test_integration_with_nested_directory_structure(self, tmp_path):
         """
@@ -219,13 +215,12 @@ Another paragraph with another footnote[^note].
 
         (deep_path / "tutorial.md").write_text("# Advanced Tutorial")
 
-        # Mock API client
-        mock_api_client = Mock(spec=GeminiAPIClient)
-        mock_api_client.translate_text.return_value = "[翻訳済み] # Advanced Tutorial"
+        # Fake API client
+        api_client = FakeGeminiAPIClient(translate_lines)
 
         # Initialize and execute
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(api_client)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -235,7 +230,7 @@ Another paragraph with another footnote[^note].
         assert results[0].success
 
         # Verify deep structure is preserved
-        output_file = source_dir / "jp" / "docs" / "en" / "guides" / "advanced" / "tutorial.md"
+        output_file = source_dir / "jp" / "docs" / "en" / "guides" / "advanced" / "[翻訳済み] tutorial.md"
         assert output_file.exists()
         assert "[翻訳済み]" in output_file.read_text()
 
@@ -251,9 +246,8 @@ Another paragraph with another footnote[^note].
         (source_dir / "good.md").write_text("# Good File")
         (source_dir / "bad.md").write_text("# Bad File")
 
-        # Mock API client
-        mock_api_client = Mock(spec=GeminiAPIClient)
-        mock_api_client.translate_text.return_value = "[翻訳済み] content"
+        # Fake API client
+        api_client = FakeGeminiAPIClient(lambda text: "[翻訳済み] content")
 
         # Mock file service to fail on specific file
         file_service = FileSystemService()
@@ -267,7 +261,7 @@ Another paragraph with another footnote[^note].
         file_service.read_file = mock_read
 
         # Initialize and execute
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(api_client)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -294,9 +288,8 @@ Another paragraph with another footnote[^note].
 
         (source_dir / "test.md").write_text("# Test")
 
-        # Mock API client
-        mock_api_client = Mock(spec=GeminiAPIClient)
-        mock_api_client.translate_text.return_value = "[翻訳済み] # Test"
+        # Fake API client
+        api_client = FakeGeminiAPIClient(lambda text: "[翻訳済み] # Test")
 
         # Mock file service to fail on write
         file_service = FileSystemService()
@@ -308,7 +301,7 @@ Another paragraph with another footnote[^note].
         file_service.write_file = mock_write
 
         # Initialize and execute
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(api_client)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -319,10 +312,224 @@ Another paragraph with another footnote[^note].
         assert "Disk full" in results[0].error_message
 
 
+    def test_concurrent_translation_processes_all_files(self, tmp_path, fake_api):
+        """
+        Test that files are translated in parallel when concurrency is raised.
+
+        Validates: Requirements 2.1, 6.1
+        """
+        source_dir = tmp_path / "docs"
+        source_dir.mkdir()
+
+        for i in range(6):
+            (source_dir / f"file{i}.md").write_text(f"# File {i}")
+
+        file_service = FileSystemService()
+        translation_service = TranslationService(fake_api)
+        orchestrator = TranslationOrchestrator(file_service, translation_service, concurrency=3)
+
+        results = orchestrator.translate_directory(source_dir)
+
+        # Results are sorted by source path regardless of completion order
+        assert [r.source_file.name for r in results] == [f"file{i}.md" for i in range(6)]
+        assert all(r.success for r in results)
+
+        output_dir = source_dir / "jp"
+        for i in range(6):
+            assert (output_dir / f"file{i}.md").read_text() == f"# File {i}"
+
+    def test_filenames_translated_in_batches(self, tmp_path, fake_api):
+        """Test that filenames are translated with one API call per batch."""
+        source_dir = tmp_path / "docs"
+        source_dir.mkdir()
+
+        for i in range(5):
+            (source_dir / f"file{i}.md").write_text(f"# File {i}")
+
+        file_service = FileSystemService()
+        translation_service = TranslationService(fake_api)
+        orchestrator = TranslationOrchestrator(
+            file_service,
+            translation_service,
+            concurrency=2,
+            filename_batch_size=2
+        )
+
+        results = orchestrator.translate_directory(source_dir)
+
+        assert len(results) == 5
+        assert all(r.success for r in results)
+
+        # 5 content calls plus ceil(5 / 2) filename calls
+        filename_calls = [text for text in fake_api.calls if not text.startswith("#")]
+        assert len(filename_calls) == 3
+        assert len(fake_api.calls) == 8
+
+    def test_incremental_rerun_skips_unchanged_files(self, tmp_path, fake_api):
+        """Test that an incremental rerun only retranslates modified files."""
+        source_dir = tmp_path / "docs"
+        source_dir.mkdir()
+
+        (source_dir / "file1.md").write_text("# File 1")
+        (source_dir / "file2.md").write_text("# File 2")
+
+        file_service = FileSystemService()
+        translation_service = TranslationService(fake_api)
+        orchestrator = TranslationOrchestrator(file_service, translation_service, incremental=True)
+
+        first = orchestrator.translate_directory(source_dir)
+        assert [r.cached for r in first] == [False, False]
+
+        # Second run: nothing changed, so no API calls and no outputs are translated again
+        fake_api.calls.clear()
+        second = orchestrator.translate_directory(source_dir)
+
+        assert all(r.success and r.cached for r in second)
+        assert fake_api.calls == []
+
+        # Third run: only the modified file is retranslated
+        (source_dir / "file2.md").write_text("# File 2, updated")
+        third = orchestrator.translate_directory(source_dir)
+
+        assert [(r.source_file.name, r.cached) for r in third] == [("file1.md", True), ("file2.md", False)]
+        assert (source_dir / "jp" / "file2.md").read_text() == "# File 2, updated"
+        assert not (source_dir / "jp" / "jp").exists()
+
+    def test_incremental_index_error_translates_all_files(self, tmp_path, fake_api):
+        """Test that a failing index check falls back to translating every file."""
+        source_dir = tmp_path / "docs"
+        source_dir.mkdir()
+
+        (source_dir / "file1.md").write_text("# File 1")
+        (source_dir / "file2.md").write_text("# File 2")
+
+        orchestrator = TranslationOrchestrator(
+            FileSystemService(), TranslationService(fake_api), incremental=True
+        )
+
+        with patch("src.orchestrator.TranslationIndex.is_unchanged", side_effect=KeyError("output")):
+            results = orchestrator.translate_directory(source_dir)
+
+        assert [(r.source_file.name, r.success, r.cached) for r in results] == [
+            ("file1.md", True, False),
+            ("file2.md", True, False),
+        ]
+        assert (source_dir / "jp" / "file1.md").exists()
+
+    def test_invalid_concurrency_raises(self):
+        """Test that a concurrency below 1 is rejected."""
+        with pytest.raises(ValueError, match="concurrency must be at least 1"):
+            TranslationOrchestrator(FileSystemService(), TranslationService(Mock()), concurrency=0)
+
+    def test_single_worker_thread_pool_completes(self, tmp_path, fake_api):
+        """Test that translation completes when the thread pool is smaller than concurrency."""
+        source_dir = tmp_path / "docs"
+        source_dir.mkdir()
+        for i in range(3):
+            (source_dir / f"file{i}.md").write_text(f"# File {i}")
+
+        orchestrator = TranslationOrchestrator(
+            FileSystemService(),
+            TranslationService(fake_api),
+            concurrency=3,
+            max_workers=1
+        )
+
+        results = orchestrator.translate_directory(source_dir)
+
+        assert [r.success for r in results] == [True, True, True]
+
+    def test_batched_translation_combines_queued_files(self, tmp_path, fake_api):
+        """Test that files already waiting to be translated share one request when batch_size is raised."""
+        orchestrator = TranslationOrchestrator(
+            FileSystemService(),
+            TranslationService(fake_api),
+            batch_size=3
+        )
+
+        async def run_translator():
+            read_queue = asyncio.Queue()
+            write_queue = asyncio.Queue()
+            for i in range(3):
+                read_queue.put_nowait((tmp_path / f"file{i}.md", f"file{i}", f"# File {i}"))
+            read_queue.put_nowait(None)
+
+            await orchestrator._translator(read_queue, write_queue, tmp_path, [])
+            return [write_queue.get_nowait() for _ in range(write_queue.qsize())]
+
+        written = asyncio.run(run_translator())
+
+        assert [content for _, _, content in written[:-1]] == [f"# File {i}" for i in range(3)]
+        assert written[-1] is None
+        assert len(fake_api.calls) == 1
+
+    def test_batched_translation_respects_max_chunk_chars(self, tmp_path, fake_api):
+        """Test that a file that would overflow max_chunk_chars starts the next batch instead."""
+        orchestrator = TranslationOrchestrator(
+            FileSystemService(),
+            TranslationService(fake_api, max_chunk_chars=20),
+            batch_size=3
+        )
+
+        async def run_translator():
+            read_queue = asyncio.Queue()
+            write_queue = asyncio.Queue()
+            for i in range(3):
+                read_queue.put_nowait((tmp_path / f"file{i}.md", f"file{i}", f"# File {i}"))
+            read_queue.put_nowait(None)
+
+            await orchestrator._translator(read_queue, write_queue, tmp_path, [])
+            return [write_queue.get_nowait() for _ in range(write_queue.qsize())]
+
+        written = asyncio.run(run_translator())
+
+        # Two 8-character files fit in one request; the third would exceed 20 characters
+        assert [content for _, _, content in written[:-1]] == [f"# File {i}" for i in range(3)]
+        assert written[-1] is None
+        assert len(fake_api.calls) == 2
+        assert "<<<S1>>>" in fake_api.calls[0]
+        assert fake_api.calls[1] == "# File 2"
+
+    def test_failed_batch_falls_back_to_single_files(self, tmp_path):
+        """Test that files are translated individually when a batched response cannot be split."""
+        source_dir = tmp_path / "docs"
+        source_dir.mkdir()
+        for i in range(3):
+            (source_dir / f"file{i}.md").write_text(f"# File {i}")
+
+        api_client = FakeGeminiAPIClient(lambda text: "garbled" if "<<<S0>>>" in text else text)
+
+        orchestrator = TranslationOrchestrator(
+            FileSystemService(),
+            TranslationService(api_client),
+            batch_size=3
+        )
+
+        results = orchestrator.translate_directory(source_dir)
+
+        assert all(r.success for r in results)
+        for i in range(3):
+            assert (source_dir / "jp" / f"file{i}.md").read_text() == f"# File {i}"
+
+    def test_translation_result_is_immutable(self, tmp_path):
+        """Test that results are frozen, slotted and hashable."""
+        result = TranslationResult(source_file=tmp_path / "doc.md", success=True)
+
+        with pytest.raises(AttributeError):
+            result.success = False
+        assert not hasattr(result, "__dict__")
+        assert result in {result}
+
+    def test_invalid_max_workers_raises(self):
+        """Test that a thread pool size below 1 is rejected."""
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            TranslationOrchestrator(FileSystemService(), TranslationService(Mock()), max_workers=0)
+
+
 class TestErrorScenarios:
     """Test various error scenarios in integration."""
 
-    def test_api_rate_limit_error_propagation(self, tmp_path):
+    def test_api_rate_limit_error_propagation(self, tmp_path, fake_api_rate_limited):
         """
         Test that rate limit errors are properly handled in integration.
 
@@ -333,13 +540,9 @@ class TestErrorScenarios:
 
         (source_dir / "test.md").write_text("# Test")
 
-        # Mock API client that raises rate limit error
-        mock_api_client = Mock(spec=GeminiAPIClient)
-        mock_api_client.translate_text.side_effect = RateLimitError("Rate limit exceeded")
-
-        # Initialize and execute
+        # Initialize and execute with an API client that raises rate limit errors
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(fake_api_rate_limited)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -360,13 +563,15 @@ class TestErrorScenarios:
 
         (source_dir / "test.md").write_text("# Test")
 
-        # Mock API client that raises generic error
-        mock_api_client = Mock(spec=GeminiAPIClient)
-        mock_api_client.translate_text.side_effect = Exception("Unexpected error")
+        # Fake API client that raises a generic error
+        def fake_translate(text):
+            raise Exception("Unexpected error")
+
+        api_client = FakeGeminiAPIClient(fake_translate)
 
         # Initialize and execute
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(api_client)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -390,14 +595,8 @@ class TestErrorScenarios:
         (source_dir / "api_error.md").write_text("# API Error")
         (source_dir / "another_success.md").write_text("# Another Success")
 
-        # Mock API client with different errors for different files
-        mock_api_client = Mock(spec=GeminiAPIClient)
-        call_count = 0
-
-        def mock_translate(text, **kwargs):
-            nonlocal call_count
-            call_count += 1
-
+        # Fake API client with different errors for different files
+        def fake_translate(text):
             if "Rate Limit" in text:
                 raise RateLimitError("Rate limit exceeded")
             elif "API Error" in text:
@@ -405,11 +604,11 @@ class TestErrorScenarios:
             else:
                 return f"[翻訳済み] {text}"
 
-        mock_api_client.translate_text.side_effect = mock_translate
+        api_client = FakeGeminiAPIClient(fake_translate)
 
         # Initialize and execute
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(api_client)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         results = orchestrator.translate_directory(source_dir)
@@ -429,7 +628,7 @@ class TestErrorScenarios:
         assert any("Rate limit" in msg for msg in error_messages)
         assert any("API connection" in msg for msg in error_messages)
 
-    def test_invalid_directory_structure_handling(self, tmp_path):
+    def test_invalid_directory_structure_handling(self, tmp_path, fake_api):
         """
         Test handling of invalid directory structures.
 
@@ -438,11 +637,25 @@ class TestErrorScenarios:
         # Test with non-existent directory
         non_existent = tmp_path / "does_not_exist"
 
-        mock_api_client = Mock(spec=GeminiAPIClient)
         file_service = FileSystemService()
-        translation_service = TranslationService(mock_api_client)
+        translation_service = TranslationService(fake_api)
         orchestrator = TranslationOrchestrator(file_service, translation_service)
 
         # Should handle gracefully and return empty results
         results = orchestrator.translate_directory(non_existent)
         assert len(results) == 0
+
+    def test_file_as_root_returns_empty_results(self, tmp_path, fake_api):
+        """Test that a regular file passed as the source directory is rejected without walking."""
+        not_a_dir = tmp_path / "file.md"
+        not_a_dir.write_text("# Not a directory")
+
+        file_service = FileSystemService()
+        orchestrator = TranslationOrchestrator(file_service, TranslationService(fake_api))
+
+        with patch.object(file_service, "iter_markdown_files") as mock_iter:
+            results = orchestrator.translate_directory(not_a_dir)
+
+        assert results == []
+        mock_iter.assert_not_called()
+        assert fake_api.calls == []
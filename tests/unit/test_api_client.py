@@ -3,7 +3,9 @@
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+from google.genai import errors as genai_errors
 from src.api_client import GeminiAPIClient
+from src.cache import TranslationCache
 from src.exceptions import APIError, RateLimitError
 
 
@@ -51,6 +53,16 @@ class TestGeminiAPIClientInit:
             mock_client.assert_called_once_with(api_key="api_key_with_spaces")
 
 
+    def test_context_manager_closes_sdk_client(self):
+        """Test that leaving a with block closes the SDK client and its connection pool."""
+        with patch('src.api_client.genai.Client') as mock_client_class:
+            with GeminiAPIClient("test_key") as client:
+                assert client.client is mock_client_class.return_value
+                mock_client_class.return_value.close.assert_not_called()
+
+            mock_client_class.return_value.close.assert_called_once()
+
+
 class TestTranslateText:
     """Tests for translate_text method."""
 
@@ -69,6 +81,44 @@ class TestTranslateText:
             assert result == "翻訳されたテキスト"
             mock_client.models.generate_content.assert_called_once()
 
+    def test_translate_text_sends_instruction_as_system_instruction(self):
+        """Test that only the text is sent as contents, with the instruction in the config."""
+        with patch('src.api_client.genai.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.text = "翻訳されたテキスト"
+            mock_client.models.generate_content.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            client = GeminiAPIClient("test_key")
+            client.translate_text("Hello world")
+            client.translate_text("Goodbye")
+
+            first, second = mock_client.models.generate_content.call_args_list
+            assert first.kwargs["contents"] == "Hello world"
+            assert "Japanese" in first.kwargs["config"].system_instruction
+            assert "Markdown" in first.kwargs["config"].system_instruction
+            # The same config object is reused across requests
+            assert second.kwargs["config"] is first.kwargs["config"]
+
+    def test_translate_text_appends_extra_instruction(self):
+        """Test that an extra instruction is appended to the system instruction in its own config."""
+        with patch('src.api_client.genai.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.text = "ガイド"
+            mock_client.models.generate_content.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            client = GeminiAPIClient("test_key")
+            client.translate_text("guide", instruction="One name per line.")
+            client.translate_text("Hello world")
+
+            with_instruction, plain = mock_client.models.generate_content.call_args_list
+            assert with_instruction.kwargs["contents"] == "guide"
+            assert with_instruction.kwargs["config"].system_instruction.endswith("One name per line.")
+            assert "One name per line." not in plain.kwargs["config"].system_instruction
+
     def test_translate_empty_text(self):
         """Test translating empty text returns empty text."""
         with patch('src.api_client.genai.Client'):
@@ -213,6 +263,157 @@ class TestTranslateText:
             assert mock_client.models.generate_content.call_count == 2
 
 
+class TestClassifyError:
+    """Tests for mapping SDK exceptions to translator exceptions."""
+
+    def test_sdk_429_is_rate_limit(self):
+        """Test that an SDK error with HTTP 429 is a RateLimitError."""
+        error = genai_errors.ClientError(
+            429,
+            {"error": {"code": 429, "message": "Resource has been exhausted", "status": "RESOURCE_EXHAUSTED"}}
+        )
+        assert isinstance(GeminiAPIClient._classify_error(error), RateLimitError)
+
+    def test_sdk_non_429_is_api_error(self):
+        """Test that other SDK errors are generic API errors even if the message mentions quota."""
+        error = genai_errors.ClientError(
+            400,
+            {"error": {"code": 400, "message": "Quota project not set", "status": "INVALID_ARGUMENT"}}
+        )
+        result = GeminiAPIClient._classify_error(error)
+        assert isinstance(result, APIError)
+        assert not isinstance(result, RateLimitError)
+
+    def test_message_tokens_without_status_code(self):
+        """Test that plain exceptions are classified by their message."""
+        assert isinstance(GeminiAPIClient._classify_error(Exception("Rate limit hit")), RateLimitError)
+        assert not isinstance(GeminiAPIClient._classify_error(Exception("Timeout")), RateLimitError)
+
+
+class TestRetryDelays:
+    """Tests for retry delay calculation."""
+
+    def test_backoff_delay_has_jitter_within_bounds(self):
+        """Test that backoff delays stay within [d/2, d] and are capped."""
+        with patch('src.api_client.genai.Client'):
+            client = GeminiAPIClient("test_key", retry_delay=1.0, rate_limit_wait=5.0)
+
+        for attempt in range(5):
+            expected = min(5.0, 2 ** attempt)
+            delay = client._backoff_delay(attempt)
+            assert expected / 2 <= delay <= expected
+
+    def test_rate_limit_uses_retry_hint_from_message(self):
+        """Test that the server-suggested delay in the error message is used."""
+        with patch('src.api_client.genai.Client') as mock_client_class, \
+                patch('src.api_client.time.sleep') as mock_sleep:
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.text = "Success"
+            mock_client.models.generate_content.side_effect = [
+                Exception("429 RESOURCE_EXHAUSTED. Please retry in 2.5s."),
+                mock_response
+            ]
+            mock_client_class.return_value = mock_client
+
+            client = GeminiAPIClient("test_key", rate_limit_wait=60.0)
+            assert client.translate_text("Hello") == "Success"
+
+            wait_time = mock_sleep.call_args.args[0]
+            assert 2.5 <= wait_time <= 2.75
+
+    def test_rate_limit_uses_retry_after_header(self):
+        """Test that a Retry-After response header is honoured."""
+        error = Exception("Quota exceeded")
+        error.response = Mock(headers={"Retry-After": "7"})
+
+        assert GeminiAPIClient._retry_after_hint(error) == 7.0
+
+    def test_rate_limit_caps_oversized_hint(self):
+        """Test that an oversized server hint is capped at a multiple of rate_limit_wait."""
+        with patch('src.api_client.genai.Client'):
+            client = GeminiAPIClient("test_key", rate_limit_wait=10.0)
+
+        error = Exception("Quota exceeded")
+        error.response = Mock(headers={"Retry-After": "86400"})
+
+        delay = client._rate_limit_delay(error)
+        assert 50.0 <= delay <= 51.0
+
+    def test_rate_limit_without_hint_is_jittered(self):
+        """Test that rate limit waits without a hint fall in [wait/2, wait]."""
+        with patch('src.api_client.genai.Client'):
+            client = GeminiAPIClient("test_key", rate_limit_wait=10.0)
+
+        delay = client._rate_limit_delay(Exception("Quota exceeded"))
+        assert 5.0 <= delay <= 10.0
+
+
+class TestTranslateTextCache:
+    """Tests for translate_text with a translation cache."""
+
+    def test_cache_hit_skips_api_call(self, tmp_path):
+        """Test that a cached translation is returned without calling the API."""
+        with patch('src.api_client.genai.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.text = "翻訳されたテキスト"
+            mock_client.models.generate_content.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            cache = TranslationCache(tmp_path / "cache.sqlite3")
+            client = GeminiAPIClient("test_key", cache=cache)
+
+            assert client.translate_text("Hello world") == "翻訳されたテキスト"
+            assert client.translate_text("Hello world") == "翻訳されたテキスト"
+
+            mock_client.models.generate_content.assert_called_once()
+            cache.close()
+
+    def test_failed_translation_is_not_cached(self, tmp_path):
+        """Test that API failures are not written to the cache."""
+        with patch('src.api_client.genai.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_client.models.generate_content.side_effect = Exception("Persistent error")
+            mock_client_class.return_value = mock_client
+
+            cache = TranslationCache(tmp_path / "cache.sqlite3")
+            client = GeminiAPIClient("test_key", max_retries=1, cache=cache)
+
+            with pytest.raises(APIError):
+                client.translate_text("Hello")
+
+            key = TranslationCache.make_key(client.model_name, "Japanese", "Hello")
+            assert cache.get(key) is None
+            cache.close()
+
+
+class TestTranslateTextRateLimiter:
+    """Tests for translate_text with a client-side request rate limit."""
+
+    def test_each_request_takes_a_token(self):
+        """Test that every API request, including retries, waits on the rate limiter."""
+        with patch('src.api_client.genai.Client') as mock_client_class:
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.text = "翻訳"
+            mock_client.models.generate_content.side_effect = [Exception("Temporary error"), mock_response]
+            mock_client_class.return_value = mock_client
+
+            client = GeminiAPIClient("test_key", retry_delay=0.01, requests_per_minute=600)
+
+            with patch.object(client._rate_limiter, 'acquire') as mock_acquire:
+                assert client.translate_text("Hello") == "翻訳"
+
+            assert mock_acquire.call_count == 2
+
+    def test_invalid_rate_raises(self):
+        """Test that a non-positive request rate is rejected."""
+        with patch('src.api_client.genai.Client'):
+            with pytest.raises(ValueError, match="requests_per_minute must be positive"):
+                GeminiAPIClient("test_key", requests_per_minute=0)
+
+
 class TestLoadApiKeyFromEnv:
     """Tests for load_api_key_from_env static method."""
 
@@ -256,6 +457,22 @@ class TestLoadApiKeyFromEnv:
         api_key = GeminiAPIClient.load_api_key_from_env(env_file)
         assert api_key == "my_api_key"
 
+    def test_load_api_key_with_spaces_and_crlf(self, tmp_path):
+        """Test loading API key with spaces around '=' and Windows line endings."""
+        env_file = tmp_path / ".env"
+        env_file.write_bytes(b"OTHER=1\r\n  key = my_api_key  \r\n")
+
+        api_key = GeminiAPIClient.load_api_key_from_env(env_file)
+        assert api_key == "my_api_key"
+
+    def test_load_api_key_ignores_commented_key(self, tmp_path):
+        """Test that a commented-out key line is skipped."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("# key=old_key\nkey=new_key")
+
+        api_key = GeminiAPIClient.load_api_key_from_env(env_file)
+        assert api_key == "new_key"
+
     def test_load_api_key_file_not_found(self, tmp_path):
         """Test FileNotFoundError when .env file doesn't exist."""
         env_file = tmp_path / "nonexistent.env"
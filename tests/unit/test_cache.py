@@ -0,0 +1,59 @@
+"""Unit tests for TranslationCache."""
+
+import pytest
+from src.cache import TranslationCache
+from src.exceptions import CacheError
+
+
+class TestTranslationCache:
+    """Test suite for TranslationCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a TranslationCache backed by a temporary database."""
+        cache = TranslationCache(tmp_path / "cache.sqlite3")
+        yield cache
+        cache.close()
+
+    def test_get_miss_returns_none(self, cache):
+        """Test that an unknown key returns None."""
+        key = TranslationCache.make_key("model", "Japanese", "Hello")
+        assert cache.get(key) is None
+
+    def test_set_and_get(self, cache):
+        """Test that a stored translation can be read back."""
+        key = TranslationCache.make_key("model", "Japanese", "Hello")
+        cache.set(key, "こんにちは")
+        assert cache.get(key) == "こんにちは"
+
+    def test_make_key_depends_on_model_language_and_instruction(self):
+        """Test that the key changes with model name, target language and extra instruction."""
+        base = TranslationCache.make_key("model-a", "Japanese", "Hello")
+        assert TranslationCache.make_key("model-b", "Japanese", "Hello") != base
+        assert TranslationCache.make_key("model-a", "French", "Hello") != base
+        assert TranslationCache.make_key("model-a", "Japanese", "  Hello\n") == base
+        assert TranslationCache.make_key("model-a", "Japanese", "Hello", "One per line.") != base
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that buffered writes are committed on close and reloaded."""
+        db_path = tmp_path / "cache.sqlite3"
+        key = TranslationCache.make_key("model", "Japanese", "Hello")
+
+        cache = TranslationCache(db_path, commit_interval=100)
+        cache.set(key, "こんにちは")
+        cache.close()
+
+        reopened = TranslationCache(db_path)
+        try:
+            assert reopened.get(key) == "こんにちは"
+        finally:
+            reopened.close()
+
+    def test_open_failure_raises_cache_error(self, tmp_path):
+        """Test that an unusable database path raises CacheError."""
+        with pytest.raises(CacheError, match="Failed to open translation cache"):
+            TranslationCache(tmp_path)
+
+    def test_uses_write_ahead_log(self, cache):
+        """Test that the database is opened in WAL mode."""
+        assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
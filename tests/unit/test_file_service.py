@@ -1,9 +1,18 @@
 """Unit tests for FileSystemService."""
 
+import asyncio
+import os
+import shutil
+import threading
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from src.file_service import FileSystemService
 from src.exceptions import FileSystemError
+from tests.helpers import write_text_fast
+
+NONEXISTENT_DIR = Path("/nonexistent/path")
+NONEXISTENT_FILE = Path("/nonexistent/file.md")
 
 
 class TestFileSystemService:
@@ -15,41 +24,28 @@ class TestFileSystemService:
         return FileSystemService()
 
     @pytest.fixture
-    def temp_dir(self, tmp_path):
+    def temp_dir(self, tmp_path, md_tree_template):
         """Create a temporary directory with test files."""
-        # Create directory structure
-        (tmp_path / "docs").mkdir()
-        (tmp_path / "docs" / "nested").mkdir()
-
-        # Create markdown files
-        (tmp_path / "README.md").write_text("# Root README")
-        (tmp_path / "docs" / "guide.md").write_text("# Guide")
-        (tmp_path / "docs" / "nested" / "deep.md").write_text("# Deep")
-
-        # Create non-markdown file
-        (tmp_path / "test.txt").write_text("Not markdown")
-
-        return tmp_path
+        # Requested explicitly (never autouse), so tests that only need an empty
+        # tmp_path or a missing path never build the session template
+        return Path(shutil.copytree(md_tree_template, tmp_path / "tree"))
 
     def test_find_markdown_files_success(self, service, temp_dir):
         """Test finding markdown files in a directory."""
         files = service.find_markdown_files(temp_dir)
 
         assert len(files) == 3
-        assert all(f.suffix == ".md" for f in files)
-        assert any(f.name == "README.md" for f in files)
-        assert any(f.name == "guide.md" for f in files)
-        assert any(f.name == "deep.md" for f in files)
+        assert {f.name for f in files} == {"README.md", "guide.md", "deep.md"}
 
     def test_find_markdown_files_nonexistent_directory(self, service):
         """Test finding files in non-existent directory raises error."""
         with pytest.raises(FileSystemError, match="does not exist"):
-            service.find_markdown_files(Path("/nonexistent/path"))
+            service.find_markdown_files(NONEXISTENT_DIR)
 
     def test_find_markdown_files_not_a_directory(self, service, tmp_path):
         """Test finding files when path is not a directory."""
         file_path = tmp_path / "test.txt"
-        file_path.write_text("test")
+        write_text_fast(file_path, "test")
 
         with pytest.raises(FileSystemError, match="not a directory"):
             service.find_markdown_files(file_path)
@@ -59,11 +55,50 @@ class TestFileSystemService:
         files = service.find_markdown_files(tmp_path)
         assert files == []
 
-    def test_read_file_success(self, service, tmp_path):
+    def test_iter_markdown_files_yields_all_files(self, service, temp_dir):
+        """Test that the lazy walk yields the same files as find_markdown_files."""
+        assert sorted(service.iter_markdown_files(temp_dir)) == service.find_markdown_files(temp_dir)
+
+    def test_iter_markdown_files_validates_eagerly(self, service):
+        """Test that an invalid directory raises before iteration starts."""
+        with pytest.raises(FileSystemError, match="does not exist"):
+            service.iter_markdown_files(NONEXISTENT_DIR)
+
+    def test_iter_markdown_files_excludes_directories(self, service, temp_dir):
+        """Test that excluded directories are not descended into."""
+        files = sorted(service.iter_markdown_files(temp_dir, exclude_dirs=[temp_dir / "docs"]))
+
+        assert files == [temp_dir / "README.md"]
+
+    def test_iter_markdown_files_skips_unreadable_subdirectory(self, service, temp_dir):
+        """Test that a subdirectory that cannot be scanned is skipped rather than aborting the walk."""
+        real_scandir = os.scandir
+        blocked = str(temp_dir / "docs" / "nested")
+
+        def scandir(path):
+            if str(path) == blocked:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        with patch("src.file_service.os.scandir", side_effect=scandir):
+            files = sorted(service.iter_markdown_files(temp_dir))
+
+        assert files == [temp_dir / "README.md", temp_dir / "docs" / "guide.md"]
+
+    def test_find_markdown_files_skips_md_named_directories(self, service, tmp_path):
+        """Test that a directory ending in .md is searched rather than returned."""
+        (tmp_path / "notes.md").mkdir()
+        write_text_fast(os.path.join(tmp_path, "notes.md", "inner.md"), "# Inner")
+
+        files = service.find_markdown_files(tmp_path)
+
+        assert files == [Path(os.path.join(tmp_path, "notes.md", "inner.md"))]
+
+    def test_read_file_success(self, service, fs):
         """Test reading file content."""
-        file_path = tmp_path / "test.md"
+        file_path = Path("/docs/test.md")
         content = "# Test Content"
-        file_path.write_text(content)
+        fs.create_file(file_path, contents=content)
 
         result = service.read_file(file_path)
         assert result == content
@@ -71,16 +106,19 @@ class TestFileSystemService:
     def test_read_file_nonexistent(self, service):
         """Test reading non-existent file raises error."""
         with pytest.raises(IOError, match="does not exist"):
-            service.read_file(Path("/nonexistent/file.md"))
+            service.read_file(NONEXISTENT_FILE)
 
-    def test_read_file_not_a_file(self, service, tmp_path):
+    def test_read_file_not_a_file(self, service, fs):
         """Test reading directory as file raises error."""
+        fs.create_dir("/docs")
+
         with pytest.raises(IOError, match="not a file"):
-            service.read_file(tmp_path)
+            service.read_file(Path("/docs"))
 
-    def test_write_file_success(self, service, tmp_path):
+    def test_write_file_success(self, service, fs):
         """Test writing file content."""
-        file_path = tmp_path / "output.md"
+        fs.create_dir("/out")
+        file_path = Path("/out/output.md")
         content = "# Output Content"
 
         service.write_file(file_path, content)
@@ -88,9 +126,9 @@ class TestFileSystemService:
         assert file_path.exists()
         assert file_path.read_text() == content
 
-    def test_write_file_creates_parent_directories(self, service, tmp_path):
+    def test_write_file_creates_parent_directories(self, service, fs):
         """Test writing file creates parent directories."""
-        file_path = tmp_path / "nested" / "deep" / "output.md"
+        file_path = Path("/out/nested/deep/output.md")
         content = "# Deep Output"
 
         service.write_file(file_path, content)
@@ -98,39 +136,95 @@ class TestFileSystemService:
         assert file_path.exists()
         assert file_path.read_text() == content
 
-    def test_create_output_path_preserves_structure(self, service, tmp_path):
-        """Test output path preserves directory structure."""
-        source_dir = tmp_path / "source"
-        source_file = source_dir / "docs" / "guide.md"
+    def test_read_write_preserve_line_endings(self, service, tmp_path):
+        """Test that CRLF line endings and non-ASCII text survive a read/write round trip."""
+        # Runs against the real filesystem, unlike the in-memory read/write tests above
+        source = tmp_path / "crlf.md"
+        source.write_bytes("# 見出し\r\n\r\n本文\r\n".encode("utf-8"))
 
-        output_path = service.create_output_path(source_file, source_dir, "jp")
+        content = service.read_file(source)
+        service.write_file(tmp_path / "out.md", content)
 
-        expected = source_dir / "jp" / "docs" / "guide.md"
-        assert output_path == expected
+        assert content == "# 見出し\r\n\r\n本文\r\n"
+        assert (tmp_path / "out.md").read_bytes() == source.read_bytes()
 
-    def test_create_output_path_root_file(self, service, tmp_path):
-        """Test output path for file in root directory."""
-        source_dir = tmp_path
-        source_file = source_dir / "README.md"
+    def test_read_file_async(self, service, tmp_path):
+        """Test reading file content asynchronously."""
+        file_path = tmp_path / "test.md"
+        write_text_fast(file_path, "# Async Content")
 
-        output_path = service.create_output_path(source_file, source_dir, "jp")
+        assert asyncio.run(service.read_file_async(file_path)) == "# Async Content"
+
+    def test_async_io_runs_on_dedicated_pool(self, service, tmp_path):
+        """Test that async reads run on the service's own I/O threads."""
+        file_path = tmp_path / "test.md"
+        write_text_fast(file_path, "# Content")
+
+        with patch.object(service, "read_file", side_effect=lambda path: threading.current_thread().name):
+            thread_name = asyncio.run(service.read_file_async(file_path))
+
+        assert thread_name.startswith("file-io")
 
-        expected = source_dir / "jp" / "README.md"
-        assert output_path == expected
+    def test_close_shuts_down_io_pool(self, tmp_path):
+        """Test that close stops the I/O threads so no further async I/O is accepted."""
+        service = FileSystemService()
+        file_path = tmp_path / "test.md"
+        write_text_fast(file_path, "# Content")
+        asyncio.run(service.read_file_async(file_path))
+
+        service.close()
+
+        with pytest.raises(RuntimeError, match="shutdown"):
+            asyncio.run(service.read_file_async(file_path))
+
+    def test_read_file_async_nonexistent(self, service):
+        """Test async read of a non-existent file raises error."""
+        with pytest.raises(IOError, match="does not exist"):
+            asyncio.run(service.read_file_async(NONEXISTENT_FILE))
 
-    def test_create_output_path_custom_output_dir(self, service, tmp_path):
-        """Test output path with custom output directory name."""
-        source_dir = tmp_path
-        source_file = source_dir / "test.md"
+    def test_write_file_async(self, service, tmp_path):
+        """Test writing file content asynchronously."""
+        file_path = Path(os.path.join(tmp_path, "nested", "output.md"))
 
-        output_path = service.create_output_path(source_file, source_dir, "translated")
+        asyncio.run(service.write_file_async(file_path, "# Async Output"))
+
+        assert file_path.read_text() == "# Async Output"
+
+    def test_write_file_recreates_removed_parent_directory(self, service, tmp_path):
+        """Test writing after the output directory was removed recreates it."""
+        first = Path(os.path.join(tmp_path, "out", "first.md"))
+        second = Path(os.path.join(tmp_path, "out", "second.md"))
+
+        service.write_file(first, "# First")
+        first.unlink()
+        first.parent.rmdir()
+        service.write_file(second, "# Second")
+
+        assert second.read_text() == "# Second"
+
+    @pytest.mark.parametrize("relative_source, output_dir_name, expected_relative", [
+        ("docs/guide.md", "jp", "jp/docs/guide.md"),
+        ("README.md", "jp", "jp/README.md"),
+        ("test.md", "translated", "translated/test.md"),
+    ], ids=["preserves_structure", "root_file", "custom_output_dir"])
+    def test_create_output_path(self, service, tmp_path, relative_source, output_dir_name, expected_relative):
+        """Test output paths mirror the source layout under the output directory."""
+        output_path = service.create_output_path(tmp_path / relative_source, tmp_path, output_dir_name)
+
+        assert output_path == tmp_path / expected_relative
+
+    def test_create_output_path_outside_source_dir(self, service, tmp_path):
+        """Test that a file outside the source directory is placed directly in the output directory."""
+        source_dir = tmp_path / "source"
+        source_file = Path(os.path.join(tmp_path, "elsewhere", "notes.md"))
+
+        output_path = service.create_output_path(source_file, source_dir, "jp")
 
-        expected = source_dir / "translated" / "test.md"
-        assert output_path == expected
+        assert output_path == source_dir / "jp" / "notes.md"
 
     def test_ensure_directory_exists_creates_directory(self, service, tmp_path):
         """Test ensuring directory exists creates it."""
-        new_dir = tmp_path / "new" / "nested" / "dir"
+        new_dir = Path(os.path.join(tmp_path, "new", "nested", "dir"))
 
         service.ensure_directory_exists(new_dir)
 
@@ -0,0 +1,38 @@
+"""Unit tests for TokenBucket."""
+
+import pytest
+from unittest.mock import patch
+from src.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    def test_burst_within_capacity_does_not_sleep(self):
+        """Test that requests up to the bucket capacity proceed immediately."""
+        bucket = TokenBucket(requests_per_minute=120)
+
+        with patch("src.rate_limiter.time.sleep") as mock_sleep:
+            bucket.acquire()
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_waits_for_next_token_when_empty(self):
+        """Test that a request beyond the capacity sleeps until a token is refilled."""
+        bucket = TokenBucket(requests_per_minute=60)
+
+        with patch("src.rate_limiter.time.monotonic", return_value=100.0), \
+                patch("src.rate_limiter.time.sleep") as mock_sleep:
+            bucket._updated = 100.0
+            bucket.acquire()
+            bucket.acquire()
+            bucket.acquire()
+
+        # One token per second: the second and third callers wait one and two seconds
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [pytest.approx(1.0), pytest.approx(2.0)]
+
+    def test_invalid_rate_raises(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError, match="requests_per_minute must be positive"):
+            TokenBucket(requests_per_minute=0)
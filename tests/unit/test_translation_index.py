@@ -0,0 +1,80 @@
+"""Unit tests for TranslationIndex."""
+
+import os
+import pytest
+from src.translation_index import INDEX_FILENAME, TranslationIndex
+
+
+class TestTranslationIndex:
+    """Test suite for TranslationIndex."""
+
+    @pytest.fixture
+    def source_file(self, tmp_path):
+        """Create a source file with a translated output next to it."""
+        source_file = tmp_path / "guide.md"
+        source_file.write_text("# Guide")
+        (tmp_path / "jp").mkdir()
+        (tmp_path / "jp" / "ガイド.md").write_text("# ガイド")
+        return source_file
+
+    def test_unknown_file_is_changed(self, tmp_path, source_file):
+        """Test that a file missing from the index is reported as changed."""
+        index = TranslationIndex(tmp_path)
+        key = TranslationIndex.stat_key(source_file)
+
+        assert not index.is_unchanged(source_file, key)
+
+    def test_recorded_file_is_unchanged_after_reload(self, tmp_path, source_file):
+        """Test that a recorded file is unchanged after the index is saved and reloaded."""
+        index = TranslationIndex(tmp_path)
+        key = TranslationIndex.stat_key(source_file)
+        index.record(source_file, key, tmp_path / "jp" / "ガイド.md")
+        index.save()
+
+        assert (tmp_path / INDEX_FILENAME).exists()
+        assert TranslationIndex(tmp_path).is_unchanged(source_file, key)
+
+    def test_modified_file_is_changed(self, tmp_path, source_file):
+        """Test that a change in size or mtime invalidates the entry."""
+        index = TranslationIndex(tmp_path)
+        key = TranslationIndex.stat_key(source_file)
+        index.record(source_file, key, tmp_path / "jp" / "ガイド.md")
+
+        source_file.write_text("# Guide, updated")
+        os.utime(source_file, ns=(key[0] + 1_000_000_000, key[0] + 1_000_000_000))
+
+        assert not index.is_unchanged(source_file, TranslationIndex.stat_key(source_file))
+
+    def test_missing_output_is_changed(self, tmp_path, source_file):
+        """Test that a deleted output file forces retranslation."""
+        index = TranslationIndex(tmp_path)
+        key = TranslationIndex.stat_key(source_file)
+        index.record(source_file, key, tmp_path / "jp" / "ガイド.md")
+
+        (tmp_path / "jp" / "ガイド.md").unlink()
+
+        assert not index.is_unchanged(source_file, key)
+
+    @pytest.mark.parametrize("data", ["[]", '{"guide.md": 1}'])
+    def test_malformed_index_is_ignored(self, tmp_path, source_file, data):
+        """Test that valid JSON with the wrong shape is treated as empty instead of raising."""
+        (tmp_path / INDEX_FILENAME).write_text(data)
+
+        index = TranslationIndex(tmp_path)
+
+        assert not index.is_unchanged(source_file, TranslationIndex.stat_key(source_file))
+
+    def test_entry_without_output_is_changed(self, tmp_path, source_file):
+        """Test that a matching entry with no output path forces retranslation."""
+        key = TranslationIndex.stat_key(source_file)
+        (tmp_path / INDEX_FILENAME).write_text(f'{{"guide.md": {{"mtime_ns": {key[0]}, "size": {key[1]}}}}}')
+
+        assert not TranslationIndex(tmp_path).is_unchanged(source_file, key)
+
+    def test_corrupt_index_is_ignored(self, tmp_path, source_file):
+        """Test that an unreadable index is treated as empty."""
+        (tmp_path / INDEX_FILENAME).write_text("{not json")
+
+        index = TranslationIndex(tmp_path)
+
+        assert not index.is_unchanged(source_file, TranslationIndex.stat_key(source_file))
@@ -1,50 +1,78 @@
 """Unit tests for TranslationService."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, MagicMock
-from src.translation_service import TranslationService
+from src.translation_service import _BATCH_INSTRUCTION, _FILENAME_INSTRUCTION, TranslationService
 from src.exceptions import TranslationError
 
+DEFAULT_TRANSLATION = "翻訳されたテキスト"
+
+
+class _StubClient:
+    """Plain stand-in for the API client that records each (text, target_language) call."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget recorded calls and go back to the default translation."""
+        self.translate = lambda text: DEFAULT_TRANSLATION
+        self.calls = []
+        self.instructions = []
+
+    def translate_text(self, text, target_language="Japanese", instruction=""):
+        self.calls.append((text, target_language))
+        self.instructions.append(instruction)
+        return self.translate(text)
+
+
+def _raise_api_error(text):
+    raise Exception("API error")
 
-class TestTranslationService:
-    """Test suite for TranslationService."""
 
-    @pytest.fixture
-    def mock_api_client(self):
-        """Create a mock API client."""
-        mock = Mock()
-        mock.translate_text = Mock(return_value="翻訳されたテキスト")
-        return mock
+@pytest.fixture(scope="module")
+def stub_client():
+    """Create a stub API client shared by the whole module."""
+    return _StubClient()
 
-    @pytest.fixture
-    def translation_service(self, mock_api_client):
-        """Create a TranslationService instance with mock API client."""
-        return TranslationService(mock_api_client)
 
-    def test_init(self, mock_api_client):
+@pytest.fixture(scope="module")
+def translation_service(stub_client):
+    """Create a TranslationService instance with the stub API client."""
+    return TranslationService(stub_client)
+
+
+@pytest.fixture(autouse=True)
+def reset_stub_client(stub_client):
+    """Restore the shared stub after each test."""
+    yield
+    stub_client.reset()
+
+
+class TestTranslationService:
+    """Test suite for TranslationService."""
+
+    def test_init(self, stub_client):
         """Test TranslationService initialization."""
-        service = TranslationService(mock_api_client)
-        assert service.api_client == mock_api_client
+        service = TranslationService(stub_client)
+        assert service.api_client == stub_client
 
     def test_translate_markdown_empty_content(self, translation_service):
         """Test translating empty content returns empty string."""
         assert translation_service.translate_markdown("") == ""
         assert translation_service.translate_markdown("   ") == "   "
 
-    def test_translate_markdown_simple_content(self, translation_service, mock_api_client):
+    def test_translate_markdown_simple_content(self, translation_service, stub_client):
         """Test translating simple markdown content."""
         content = "# Hello World\n\nThis is a test."
-        mock_api_client.translate_text.return_value = "# こんにちは世界\n\nこれはテストです。"
+        stub_client.translate = lambda text: "# こんにちは世界\n\nこれはテストです。"
 
         result = translation_service.translate_markdown(content)
 
         assert result == "# こんにちは世界\n\nこれはテストです。"
-        mock_api_client.translate_text.assert_called_once_with(
-            content,
-            target_language="Japanese"
-        )
+        assert stub_client.calls == [(content, "Japanese")]
 
-    def test_translate_markdown_with_footnotes(self, translation_service, mock_api_client):
+    def test_translate_markdown_with_footnotes(self, translation_service, stub_client):
         """Test translating markdown with footnotes preserves footnotes."""
         content = """# Title
 
@@ -52,8 +80,8 @@ Some text with a footnote[^1].
 
 [^1]: This is a footnote."""
 
-        # Mock the API to return translated content (without the footnote definition)
-        mock_api_client.translate_text.return_value = """# タイトル
+        # Make the API return translated content (without the footnote definition)
+        stub_client.translate = lambda text: """# タイトル
 
 脚注付きのテキスト[^1]。
 
@@ -65,111 +93,220 @@ __FOOTNOTE_0__"""
         assert "[^1]: This is a footnote." in result
         assert "タイトル" in result
 
-    def test_translate_markdown_api_error(self, translation_service, mock_api_client):
+    def test_translate_markdown_api_error(self, translation_service, stub_client):
         """Test that API errors are wrapped in TranslationError."""
-        mock_api_client.translate_text.side_effect = Exception("API error")
+        stub_client.translate = _raise_api_error
 
         with pytest.raises(TranslationError) as exc_info:
             translation_service.translate_markdown("# Test")
 
         assert "Failed to translate markdown" in str(exc_info.value)
 
-    def test_preprocess_markdown_no_footnotes(self, translation_service):
-        """Test preprocessing markdown without footnotes."""
-        content = "# Title\n\nSome text."
+    @pytest.mark.parametrize("content, expected_footnotes", [
+        ("# Title\n\nSome text.", []),
+        ("# Title\n\nText with footnote[^1].\n\n[^1]: Footnote text.", ["[^1]: Footnote text."]),
+        (
+            "# Title\n\nText with footnote[^1] and another[^note].\n\n[^1]: First footnote.\n[^note]: Second footnote.",
+            ["[^1]: First footnote.", "[^note]: Second footnote."],
+        ),
+        (
+            "# Title\n\nText[^1].\n\n[^1]: First line.\n    Second line indented.",
+            ["[^1]: First line.\n    Second line indented."],
+        ),
+    ], ids=["no_footnotes", "single_footnote", "multiple_footnotes", "multiline_footnote"])
+    def test_footnote_round_trip(self, translation_service, content, expected_footnotes):
+        """Test that footnotes are swapped for placeholders and restored unchanged."""
         processed, footnotes = translation_service.preprocess_markdown(content)
 
-        assert processed == content
-        assert footnotes == []
+        assert footnotes == expected_footnotes
+        for index, footnote in enumerate(footnotes):
+            assert f"__FOOTNOTE_{index}__" in processed
+            assert footnote not in processed
+        assert translation_service.postprocess_markdown(processed, footnotes) == content
 
-    def test_preprocess_markdown_single_footnote(self, translation_service):
-        """Test preprocessing markdown with a single footnote."""
-        content = """# Title
+    def test_preprocess_markdown_footnote_boundaries(self, translation_service):
+        """Test that a footnote ends at a blank line, an unindented line, or the next definition."""
+        content = "[^1]: One.\n\tcontinued\n    [^2]: Two.\nBody text.\n[^3]: Three.\n\n    indented code\n"
+
+        processed, footnotes = translation_service.preprocess_markdown(content)
+
+        assert footnotes == ["[^1]: One.\n\tcontinued", "    [^2]: Two.", "[^3]: Three."]
+        assert processed == (
+            "__FOOTNOTE_0__\n__FOOTNOTE_1__\nBody text.\n__FOOTNOTE_2__\n\n    indented code\n"
+        )
+
+    def test_postprocess_markdown_unknown_placeholder(self, translation_service):
+        """Test that placeholders without a matching footnote are left as-is."""
+        translated = "__FOOTNOTE_0__\n__FOOTNOTE_5__"
+        footnotes = ["[^1]: Only footnote."]
+
+        result = translation_service.postprocess_markdown(translated, footnotes)
 
-Text with footnote[^1].
+        assert result == "[^1]: Only footnote.\n__FOOTNOTE_5__"
 
-[^1]: Footnote text."""
+    def test_translate_markdown_empty_content_only(self, translation_service):
+        """Test translating content with only footnotes."""
+        content = "[^1]: Just a footnote."
 
         processed, footnotes = translation_service.preprocess_markdown(content)
 
         assert len(footnotes) == 1
-        assert footnotes[0] == "[^1]: Footnote text."
-        assert "__FOOTNOTE_0__" in processed
-        assert "[^1]: Footnote text." not in processed
+        assert footnotes[0] == "[^1]: Just a footnote."
 
-    def test_preprocess_markdown_multiple_footnotes(self, translation_service):
-        """Test preprocessing markdown with multiple footnotes."""
-        content = """# Title
+    def test_translate_filenames_single_call(self, translation_service, stub_client):
+        """Test that all filename stems are translated in one API call."""
+        stub_client.translate = lambda text: "ガイド\nはじめに\n"
 
-Text with footnote[^1] and another[^note].
+        result = translation_service.translate_filenames(["guide", "getting-started"])
 
-[^1]: First footnote.
-[^note]: Second footnote."""
+        assert result == ["ガイド", "はじめに"]
+        assert stub_client.calls == [("guide\ngetting-started", "Japanese")]
 
-        processed, footnotes = translation_service.preprocess_markdown(content)
+    def test_translate_filenames_sends_line_instruction(self, translation_service, stub_client):
+        """Test that filename batches ask for one translation per line in the same order."""
+        stub_client.translate = lambda text: "ガイド\nはじめに\n"
 
-        assert len(footnotes) == 2
-        assert footnotes[0] == "[^1]: First footnote."
-        assert footnotes[1] == "[^note]: Second footnote."
-        assert "__FOOTNOTE_0__" in processed
-        assert "__FOOTNOTE_1__" in processed
+        translation_service.translate_filenames(["guide", "getting-started"])
 
-    def test_preprocess_markdown_multiline_footnote(self, translation_service):
-        """Test preprocessing markdown with multiline footnote."""
-        content = """# Title
+        assert stub_client.instructions == [_FILENAME_INSTRUCTION]
+        assert "one translated file name per line" in _FILENAME_INSTRUCTION
+        assert "same order" in _FILENAME_INSTRUCTION
 
-Text[^1].
+    def test_translate_filenames_empty_list(self, translation_service, stub_client):
+        """Test that an empty list of stems makes no API call."""
+        assert translation_service.translate_filenames([]) == []
+        assert stub_client.calls == []
 
-[^1]: First line.
-    Second line indented."""
+    def test_translate_filenames_line_count_mismatch(self, translation_service, stub_client):
+        """Test that a response with the wrong number of lines raises TranslationError."""
+        stub_client.translate = lambda text: "ガイドとはじめに"
 
-        processed, footnotes = translation_service.preprocess_markdown(content)
+        with pytest.raises(TranslationError, match="Expected 2 translated filenames"):
+            translation_service.translate_filenames(["guide", "getting-started"])
 
-        assert len(footnotes) == 1
-        assert "First line.\n    Second line indented." in footnotes[0]
-        assert "__FOOTNOTE_0__" in processed
+    def test_translate_filenames_api_error(self, translation_service, stub_client):
+        """Test that API errors are wrapped in TranslationError."""
+        stub_client.translate = _raise_api_error
 
-    def test_postprocess_markdown_no_footnotes(self, translation_service):
-        """Test postprocessing without footnotes."""
-        content = "# Translated Title"
-        result = translation_service.postprocess_markdown(content, [])
+        with pytest.raises(TranslationError, match="Failed to translate filenames"):
+            translation_service.translate_filenames(["guide"])
 
-        assert result == content
+    def test_translate_markdown_skips_untranslatable_content(self, translation_service, stub_client):
+        """Test that code-only and number-only documents are returned without an API call."""
+        code_only = "```python\nprint('hello')\n```\n"
+        numbers_only = "| 1 | 2 |\n|---|---|\n| 3 | 4 |\n\n[^1]: A note."
 
-    def test_postprocess_markdown_restore_footnotes(self, translation_service):
-        """Test postprocessing restores footnotes."""
-        translated = """# タイトル
+        assert translation_service.translate_markdown(code_only) == code_only
+        assert asyncio.run(translation_service.translate_markdown_async(numbers_only)) == numbers_only
+        assert stub_client.calls == []
 
-テキスト[^1]。
+    def test_translate_markdown_inline_triple_backticks_are_prose(self, stub_client):
+        """Test that a line starting with inline ``` code is not treated as a fence opener."""
+        service = TranslationService(stub_client, min_translatable_chars=4)
+        content = "```bash``` is the tag to use.\n"
 
-__FOOTNOTE_0__"""
-        footnotes = ["[^1]: Original footnote."]
+        service.translate_markdown(content)
 
-        result = translation_service.postprocess_markdown(translated, footnotes)
+        assert len(stub_client.calls) == 1
 
-        assert "[^1]: Original footnote." in result
-        assert "__FOOTNOTE_0__" not in result
+    def test_translate_markdown_min_translatable_chars(self, stub_client):
+        """Test that documents with fewer letters than the threshold are not translated."""
+        stub_client.translate = lambda text: "翻訳"
+        service = TranslationService(stub_client, min_translatable_chars=4)
 
-    def test_postprocess_markdown_multiple_footnotes(self, translation_service):
-        """Test postprocessing restores multiple footnotes."""
-        translated = """# タイトル
+        assert service.translate_markdown("# API") == "# API"
+        assert service.translate_markdown("# Guide") == "翻訳"
+        assert len(stub_client.calls) == 1
 
-__FOOTNOTE_0__
-__FOOTNOTE_1__"""
-        footnotes = ["[^1]: First.", "[^2]: Second."]
+    def test_translate_batch_single_call(self, translation_service, stub_client):
+        """Test that several documents are translated in one API call and split back apart."""
+        stub_client.translate = lambda text: (
+            "<<<S0>>>\n# ガイド\n<<<E0>>>\n<<<S1>>>\n# はじめに[^1]\n\n__FOOTNOTE_0__\n<<<E1>>>"
+        )
 
-        result = translation_service.postprocess_markdown(translated, footnotes)
+        result = translation_service.translate_batch(
+            ["# Guide", "# Getting started[^1]\n\n[^1]: A note."]
+        )
 
-        assert "[^1]: First." in result
-        assert "[^2]: Second." in result
-        assert "__FOOTNOTE_0__" not in result
-        assert "__FOOTNOTE_1__" not in result
+        assert result == ["# ガイド", "# はじめに[^1]\n\n[^1]: A note."]
+        assert len(stub_client.calls) == 1
+        prompt = stub_client.calls[0][0]
+        assert "<<<S1>>>\n# Getting started[^1]\n\n__FOOTNOTE_0__\n<<<E1>>>" in prompt
+        # The marker instruction is a system instruction, not part of the text to translate
+        assert prompt.startswith("<<<S0>>>\n")
+        assert stub_client.instructions == [_BATCH_INSTRUCTION]
 
-    def test_translate_markdown_empty_content_only(self, translation_service):
-        """Test translating content with only footnotes."""
-        content = "[^1]: Just a footnote."
+    def test_translate_batch_preserves_trailing_newline(self, translation_service, stub_client):
+        """Test that each document keeps its trailing newline even if the response drops it."""
+        stub_client.translate = lambda text: "<<<S0>>>\n# ガイド\n<<<E0>>>\n<<<S1>>>\n# はじめに\n<<<E1>>>"
 
-        processed, footnotes = translation_service.preprocess_markdown(content)
+        result = translation_service.translate_batch(["# Guide\n", "# Getting started"])
 
-        assert len(footnotes) == 1
-        assert footnotes[0] == "[^1]: Just a footnote."
+        assert result == ["# ガイド\n", "# はじめに"]
+
+    def test_translate_batch_missing_section(self, translation_service, stub_client):
+        """Test that a response missing a section raises TranslationError."""
+        stub_client.translate = lambda text: "<<<S0>>>\n# ガイド\n<<<E0>>>"
+
+        with pytest.raises(TranslationError, match="Expected 2 translated sections"):
+            translation_service.translate_batch(["# Guide", "# Getting started"])
+
+    def test_translate_batch_skips_blank_documents(self, translation_service, stub_client):
+        """Test that blank documents are returned unchanged and a lone document is sent without markers."""
+        stub_client.translate = lambda text: "# ガイド"
+
+        result = translation_service.translate_batch(["", "# Guide"])
+
+        assert result == ["", "# ガイド"]
+        assert stub_client.calls == [("# Guide", "Japanese")]
+
+    def test_split_sections_small_content_single_chunk(self, translation_service):
+        """Test that content below the size limit is not split."""
+        content = "# Title\n\n## Section\n\nText."
+        assert translation_service._split_sections(content) == [content]
+
+    def test_split_sections_at_level2_headings(self, stub_client):
+        """Test that large content is split before level-2 headings."""
+        service = TranslationService(stub_client, max_chunk_chars=20)
+        content = "# Title\n\n## One\n\nFirst.\n\n## Two\n\nSecond.\n"
+
+        chunks = service._split_sections(content)
+
+        assert chunks == ["# Title\n\n", "## One\n\nFirst.\n\n", "## Two\n\nSecond.\n"]
+        assert "".join(chunks) == content
+
+    def test_split_sections_ignores_headings_in_code_fences(self, stub_client):
+        """Test that `## ` lines inside fenced code blocks do not start a section."""
+        service = TranslationService(stub_client, max_chunk_chars=10)
+        content = "## Shell\n\n```\n## not a heading\n```\n"
+
+        assert service._split_sections(content) == [content]
+
+    def test_translate_markdown_async_translates_sections(self, stub_client):
+        """Test that each section is translated separately and reassembled in order."""
+        service = TranslationService(stub_client, max_chunk_chars=20)
+        stub_client.translate = lambda text: f"[JA] {text.strip()}"
+        content = "## One\n\nFirst.[^1]\n\n## Two\n\nSecond.\n\n[^1]: Note."
+
+        result = asyncio.run(service.translate_markdown_async(content))
+
+        assert len(stub_client.calls) == 2
+        assert result == "[JA] ## One\n\nFirst.[^1]\n\n[JA] ## Two\n\nSecond.\n\n[^1]: Note."
+
+    def test_translate_markdown_sections_keep_source_whitespace(self, stub_client):
+        """Test that the whitespace after each section and the final newline survive reassembly."""
+        service = TranslationService(stub_client, max_chunk_chars=20)
+        stub_client.translate = lambda text: f"[JA] {text.strip()}"
+        content = "## One\n\nFirst.\n\n\n## Two\n\nSecond.\n"
+
+        result = service.translate_markdown(content)
+
+        assert len(stub_client.calls) == 2
+        assert result == "[JA] ## One\n\nFirst.\n\n\n[JA] ## Two\n\nSecond.\n"
+
+    def test_translate_markdown_async_api_error(self, translation_service, stub_client):
+        """Test that API errors in the async path are wrapped in TranslationError."""
+        stub_client.translate = _raise_api_error
+
+        with pytest.raises(TranslationError, match="Failed to translate markdown"):
+            asyncio.run(translation_service.translate_markdown_async("# Test"))